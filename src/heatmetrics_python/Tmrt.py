@@ -26,6 +26,7 @@ def Tmrt(SSRD, SSR, FDIR, STRD, STR, cza):
     epsilon = 0.97          # emissivity of clothed human body (standard value)
     fa = 0.50               # angle factor
     alphaIR = 0.70          # absorption coefficient for body irradiation of solar radiation (standard value)
+    GAMMA_DEG2_COEF = (180 / math.pi) ** 2 / 50000
 
     dsw = SSRD - FDIR
     rsw = SSRD - SSR
@@ -33,16 +34,18 @@ def Tmrt(SSRD, SSR, FDIR, STRD, STR, cza):
 
     # calculate fp projected factor area
     #
-    gamma = math.asin(cza) * 180 / math.pi # in degrees
-    fp = 0.308 * math.cos((math.pi / 180) * gamma * 0.998 - (gamma * gamma / 50000))
+    # gamma is the solar elevation in radians; the 1/50000 coefficient applies to
+    # gamma in degrees and is rescaled by (180/pi)^2 rather than converting gamma
+    gamma = math.asin(cza)
+    fp = 0.308 * math.cos(gamma * (0.998 - gamma * GAMMA_DEG2_COEF))
 
     if cza > 0.01:
         FDIR = FDIR / cza
 
-    # calculate mean radiant temperature
-    mrt = ((1 / sigma) *
+    # calculate mean radiant temperature; the fourth root is taken as two square roots
+    mrt = math.sqrt(math.sqrt((1 / sigma) *
             (fa * STRD +
                fa * lur +
-               (alphaIR / epsilon) * (fa * dsw + fa * rsw + fp * FDIR))) ** 0.25
+               (alphaIR / epsilon) * (fa * dsw + fa * rsw + fp * FDIR))))
 
     return mrt
@@ -1,15 +1,8 @@
 import numpy as np
-import math
-from . import esat 
-from .esat import esat
-from . import dew_point
-from .dew_point import dew_point
-from . import h_cylinder_in_air
-from .h_cylinder_in_air import h_cylinder_in_air
-from . import emis_atm
-from .emis_atm import emis_atm
-from . import viscosity
-from .viscosity import viscosity
+from .esat import _esat_base, _enhancement_factor
+from .dew_point import _dew_point_base
+from .h_cylinder_in_air import _h_cylinder_in_air
+from .emis_atm import _emis_atm
 from . import diffusivity
 from .diffusivity import diffusivity
 from . import evap
@@ -21,33 +14,45 @@ def Twb(Tair, rh, Pair, speed, solar, fdir, cza):
 
     Calculates the natural wet-bulb temperature.
 
+    The energy balance is solved with Newton's method to within 1e-4 K. Results
+    differ from the former damped fixed-point iteration (tolerance 0.02 K) by up
+    to about 0.02 K. Newton's method also converges where that iteration did
+    not, most notably when cza is below 0.01 (and so is treated as 0.01) while
+    the direct-beam irradiance is high. There the radiative term dominates, and
+    the returned temperature can be far above Tair (about 55-65 deg C on random
+    inputs; the matching globe temperature can exceed 400 deg C). Such inputs, with
+    strong direct sun and the sun at the horizon, are not physically consistent;
+    wbgt() returns NaN for them. Derive solar, fdir, and cza together, e.g. with
+    calc_solar_parameters(), to avoid them.
+
     :param Tair: Air temperature (dry bulb) in Kelvin (K)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :param rh: Relative humidity as a proportion (0-1)
-    :type rh: float
+    :type rh: float or numpy.ndarray
     :param Pair: Barometric pressure in millibars	(equivalent to hPa)
-    :type Pair: float
+    :type Pair: float or numpy.ndarray
     :param speed: Wind speed (m/s)
-    :type speed: float
+    :type speed: float or numpy.ndarray
     :param solar: Solar irradiance (W/m2)
-    :type solar: float
+    :type solar: float or numpy.ndarray
     :param fdir: Fraction of solar irradiance due to direct beam
-    :type fdir: float
+    :type fdir: float or numpy.ndarray
     :param cza: Cosine of solar zenith angle
-    :type cza: float
-    :returns: the natural wet-bulb temperature in degrees Celsius ( C)
-    :rtype: float
-    :examples: Twb(293, 0.65, 1013, 4, 700, 0.1, 0.308)
+    :type cza: float or numpy.ndarray
+    :returns: the natural wet-bulb temperature in degrees Celsius ( C), or NaN
+        where the iteration does not converge
+    :rtype: float or numpy.ndarray
+    :examples: Twb(293, 0.65, 1013, 4, 700, 0.1, 0.308) returns 18.0015
     """
 
     rad = 1  # indicator for wet-bulb temperature; 0 for psychrometric wet-bulb temperature
 
-    if cza < 0.01:
-        cza = 0.01 
+    cza = np.where(cza < 0.01, 0.01, cza)
 
     # CONSTANTS ___________________________________________________________________
-    CONVERGENCE = 0.02
-    MAX_ITER = 100
+    CONVERGENCE = 1e-4
+    MAX_ITER = 20
+    MAX_STEP = 10.0
     D_WICK = 0.007
     L_WICK = 0.0254
     PI = 3.1415926535897932
@@ -67,42 +72,69 @@ def Twb(Tair, rh, Pair, speed, solar, fdir, cza):
   
     # VARIABLES ___________________________________________________________________
     Tsfc = Tair
-    sza = math.acos(cza)             # solar zenith angle, radians
-    eair = rh * esat(Tair, 0, Pair)
-    Tdew = dew_point(eair, 0, Pair)  # needs Pair to calculate the enhancement factor
+    tan_sza = np.sqrt(1 - cza * cza) / cza  # tan(arccos(cza)), tangent of the solar zenith angle
+    EF = _enhancement_factor(Pair)       # shared by every esat and dew-point evaluation below
+    eair = rh * (EF * _esat_base(Tair))
+    Tdew = _dew_point_base(eair / EF)
     Twb_prev = Tdew                  # first guess is the dew-point temperature
-    converged = False
-    iteration = 0
 
-    while not converged:
-        iteration = iteration + 1
+    # Longwave (atmosphere and surface) and solar heating terms; neither depends on Twb.
+    # The atmospheric emissivity reuses eair rather than evaluating esat() again
+    Tair2 = Tair * Tair
+    Tsfc2 = Tsfc * Tsfc
+    atm_term = 0.5 * (_emis_atm(eair) * Tair2 * Tair2 + EMIS_SFC * Tsfc2 * Tsfc2)
+    solar_term = (1 - ALB_WICK) * solar * ((1 - fdir) * (1 + 0.25 * D_WICK / L_WICK) +
+        fdir * ((tan_sza / PI) + 0.25 * D_WICK / L_WICK) + ALB_SFC)
+
+    # Iterate all cells together. Cells that have converged are written to the
+    # output and dropped, so each iteration only evaluates the cells still iterating
+    shape = np.broadcast(Tair, Pair, speed, atm_term, solar_term, EF, eair, Twb_prev).shape
+    Twb_out = np.full(shape, np.nan)
+    cells = np.arange(Twb_out.size).reshape(shape)
+    for iteration in range(MAX_ITER):
         Tref = 0.5 * (Twb_prev + Tair)	# evaluate properties at the average temperature
 
-        # Calculate convective heat transfer coefficient (h)
-        h = h_cylinder_in_air(D_WICK, L_WICK, Tref, Pair, speed)
+        # Calculate convective heat transfer coefficient (h), along with the air
+        # density and viscosity that are reused for the Schmidt number
+        h, density, mu = _h_cylinder_in_air(D_WICK, L_WICK, Tref, Pair, speed)
 
         # Calculate radiative heating term
-        Fatm = STEFANB * EMIS_WICK * (0.5 * (emis_atm(Tair, rh, Pair) * (Tair ** 4) + EMIS_SFC * (Tsfc ** 4)) -
-            (Twb_prev ** 4)) + (1 - ALB_WICK) * solar * ((1 - fdir) * (1 + 0.25 * D_WICK / L_WICK) +
-            fdir * ((math.tan(sza) / PI) + 0.25 * D_WICK / L_WICK) + ALB_SFC)
+        Twb_prev2 = Twb_prev * Twb_prev
+        Fatm = STEFANB * EMIS_WICK * (atm_term - Twb_prev2 * Twb_prev2) + solar_term
 
-        ewick = esat(Twb_prev, 0, Pair)
-        density = Pair * 100 / (R_AIR * Tref)
+        ewick = EF * _esat_base(Twb_prev)
 
         # Calculate Schmidt number (Sc)
-        Sc = viscosity(Tref) / (density * diffusivity(Tref, Pair))
+        Sc = mu / (density * diffusivity(Tref, Pair))
+
+        # Energy balance Twb = F(Twb)
+        evap_term = evap(Tref) / RATIO * ((Pr / Sc) ** a)
+        F = Tair - evap_term * (ewick - eair) / (Pair - ewick) + (Fatm / h * rad)
 
-        Twb_new = Tair - evap(Tref) / RATIO * (ewick - eair) / (Pair - ewick) * ((Pr / Sc) ** a) + (Fatm / h * rad)
-    
-        if abs(Twb_new - Twb_prev) < CONVERGENCE:
-            converged = True
+        # Newton step on Twb - F(Twb) = 0, holding the properties evaluated at Tref
+        # fixed; the derivative of ewick follows from the formula in esat(). The
+        # step is limited so that a first guess far below the root cannot jump past
+        # the boiling point, where the evaporation term changes sign
+        dewick = ewick * 17.502 * 240.97 / ((Twb_prev - 32.18) * (Twb_prev - 32.18))
+        dF = (-evap_term * dewick * (Pair - eair) / ((Pair - ewick) * (Pair - ewick)) -
+              4 * STEFANB * EMIS_WICK * Twb_prev2 * Twb_prev / h * rad)
+        Twb_new = Twb_prev - np.clip((Twb_prev - F) / (1 - dF), -MAX_STEP, MAX_STEP)
 
-        Twb_prev = 0.9 * Twb_prev + 0.1 * Twb_new
+        converged = np.abs(Twb_new - Twb_prev) < CONVERGENCE
 
-        if (converged) or (iteration == MAX_ITER):
+        if np.all(converged):
+            Twb_out.flat[cells] = Twb_new - 273.15
             break
 
-    if converged:
-        return Twb_new - 273.15
-    else:
-        return np.nan
+        if np.any(converged):
+            # Write out the cells that have converged and drop them from the iteration
+            Twb_out.flat[cells[converged]] = Twb_new[converged] - 273.15
+            iterating = ~converged
+            cells = cells[iterating]
+            Tair, Pair, speed, atm_term, solar_term, EF, eair = (
+                np.broadcast_to(x, converged.shape)[iterating] for x in (Tair, Pair, speed, atm_term, solar_term, EF, eair))
+            Twb_prev = Twb_new[iterating]
+        else:
+            Twb_prev = Twb_new
+
+    return Twb_out[()]
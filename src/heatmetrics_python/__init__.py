@@ -8,4 +8,5 @@ from . import Tmrt
 from . import Tpsy
 from . import calc_cza_int
 from . import calc_fdir
+from . import solarposition_batch
 
@@ -1,7 +1,8 @@
-import datetime
-import math
+import numpy as np
 from . import calc_solarDA
-from .calc_solarDA import calc_solarDA
+from .calc_solarDA import calc_solarDA, DEG_RAD
+from . import daynum
+from .daynum import daynum
 
 
 def calc_cza(lat, lon, y, mon, d, hr):
@@ -11,9 +12,9 @@ def calc_cza(lat, lon, y, mon, d, hr):
     be obtained with calc_cza_int(), which calls this function and integrates over the hour.
 
     :param lat: Degrees north latitude (-90 to 90)
-    :type lat: float
+    :type lat: float or numpy.ndarray
     :param lon: Degrees east longitude (-180 to 180)
-    :type lon: float
+    :type lon: float or numpy.ndarray
     :param y: Year (four digits, e.g., 2020)
     :type y: int
     :param mon: Month (1-12)
@@ -21,40 +22,79 @@ def calc_cza(lat, lon, y, mon, d, hr):
     :param d: Day of month (whole number)
     :type d: int
     :param hr: Hour (0-24 UTC)
-    :type hr: int
+    :type hr: float or numpy.ndarray
     :returns: cosine of the solar zenith angle (cza)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: calc_cza(30, -100, 2020, 1, 1, 12)
     """
 
-    dt = datetime.datetime.strptime(f"{y:04d}-{mon:02d}-{d:02d}",
-                                    "%Y-%m-%d") + datetime.timedelta(hours=hr)
- 
-    # Calculate Julian Day; note index starts at 0 - add 1 so that Jan. 1 = 1.
-    #
-    jd = int(dt.strftime("%j"))
+    d_rad, sha0 = _solar_time_terms(y, mon, d, hr)
+    return _cza(lat, lon, d_rad, sha0)
+
+
+def _solar_time_terms(y, mon, d, hr):
+    """Time-dependent part of calc_cza()
+
+    Returns the solar declination (radians) and the solar hour angle at
+    longitude 0 (degrees). These depend only on the date and hour, so they can be
+    shared by every location at that time.
+    """
 
-    if hr < 0:
-        hr = 24 + hr
+    # Split hr into whole days and an hour in [0, 24), and carry the days into the
+    # Julian Day (Jan. 1 = 1), wrapping into the previous or next year
+    #
+    day_offset, hr = np.divmod(hr, 24)
+    jd = daynum(y, mon, d) + day_offset
+    jd = np.where(jd < 1, jd + daynum(y - 1, 12, 31), jd)
+    jd = np.where(jd > daynum(y, 12, 31), jd - daynum(y, 12, 31), jd)
 
     # declination angle + time correction for solar angle
-    d_tc = calc_solarDA(jd, hr)
-    d = d_tc['d']
-    tc = d_tc['tc']
+    d, tc = calc_solarDA(jd, hr)
+
+    return d * DEG_RAD, (hr - 12) * 15 + tc
+
 
-    d_rad = d * (math.pi / 180)
+def _cza(lat, lon, d_rad, sha0):
+    """Location-dependent part of calc_cza(), from _solar_time_terms()"""
 
-    lat_rad = lat * (math.pi / 180)
+    lat_rad = lat * DEG_RAD
 
-    sindec_sinlat = math.sin(d_rad) * math.sin(lat_rad)
-    cosdec_coslat = math.cos(d_rad) * math.cos(lat_rad)
+    sindec_sinlat = np.sin(d_rad) * np.sin(lat_rad)
+    cosdec_coslat = np.cos(d_rad) * np.cos(lat_rad)
 
     # solar hour angle [h.deg]
-    sha_rad = ((hr - 12) * 15 + lon + tc) * (math.pi / 180)
-    csza = sindec_sinlat + cosdec_coslat * math.cos(sha_rad)
+    sha_rad = (sha0 + lon) * DEG_RAD
+    csza = sindec_sinlat + cosdec_coslat * np.cos(sha_rad)
+
+    return np.maximum(csza, 0)
+
 
-    if csza < 0:
-        csza = 0
+def calc_cza_grid(lats, lons, y, mon, d, hr):
+    """Calculate the cosine of the solar zenith angle on a latitude-longitude grid
+
+    Evaluates calc_cza() at every combination of the given latitudes and longitudes
+    for one time step. The declination and time correction are computed once for the
+    time step, the latitude terms once per row, and the hour angle once per column.
+
+    :param lats: Degrees north latitude (-90 to 90)
+    :type lats: numpy.ndarray
+    :param lons: Degrees east longitude (-180 to 180)
+    :type lons: numpy.ndarray
+    :param y: Year (four digits, e.g., 2020)
+    :type y: int
+    :param mon: Month (1-12)
+    :type mon: int
+    :param d: Day of month (whole number)
+    :type d: int
+    :param hr: Hour (0-24 UTC)
+    :type hr: float
+    :returns: cosine of the solar zenith angle (cza), with one row per latitude and
+        one column per longitude
+    :rtype: numpy.ndarray
+    :examples: calc_cza_grid(np.arange(-60, 61, 30), np.arange(-180, 180, 45), 2020, 7, 4, 12)
+    """
 
-    return csza
+    lats = np.asarray(lats)[:, np.newaxis]
+    lons = np.asarray(lons)[np.newaxis, :]
 
+    return calc_cza(lats, lons, y, mon, d, hr)
@@ -1,7 +1,30 @@
 import math
+from functools import lru_cache
 import numpy as np
-from . import calc_cza
-from .calc_cza import calc_cza
+from .calc_cza import _solar_time_terms, _cza
+
+# Three-point Gauss-Legendre nodes and weights on [-1, 1]
+_E = np.array([-math.sqrt(3.0 / 5.0), 0.0, math.sqrt(3.0 / 5.0)])
+_W = np.array([(5.0 / 9.0), (8.0 / 9.0), (5.0 / 9.0)])
+
+# The two hours around hr are integrated as [-1, 0] and [0, 1]; these are
+# the six quadrature nodes as offsets from hr, and their weights
+_OFFSETS = np.concatenate((0.5 * _E - 0.5, 0.5 * _E + 0.5))
+_WEIGHTS = 0.5 * np.tile(_W, 2)
+
+@lru_cache(maxsize=4096)
+def _node_time_terms(y, mon, d, hr):
+    """Declination and hour angle at the quadrature nodes around hr
+
+    Cached, since scalar calls for many locations at the same time repeat the same
+    date and hour. The returned arrays are read-only.
+    """
+
+    d_rad, sha0 = _solar_time_terms(y, mon, d, hr + _OFFSETS)
+    d_rad.setflags(write=False)
+    sha0.setflags(write=False)
+    return d_rad, sha0
+
 
 def calc_cza_int(lat, lon, y, mon, d, hr):
     """Calculate the cosine solar zenith angle integrated over the hour
@@ -13,9 +36,9 @@ def calc_cza_int(lat, lon, y, mon, d, hr):
     only for use with hourly time steps.
 
     :param lat: Degrees north latitude (-90 to 90)
-    :type lat: float
+    :type lat: float or numpy.ndarray
     :param lon: Degrees east longitude (-180 to 180)
-    :type lon: float
+    :type lon: float or numpy.ndarray
     :param y: Year (four digits, e.g., 2020)
     :type y: int
     :param mon: Month (1-12)
@@ -23,41 +46,19 @@ def calc_cza_int(lat, lon, y, mon, d, hr):
     :param d: Day of month (whole number)
     :type d: int
     :param hr: Hour (0-24 UTC)
-    :type hr: int
+    :type hr: float or numpy.ndarray
     :returns: the integrated cosine of the solar zenith angle (cza).
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: calc_cza_int(30, -100, 2020, 1, 1, 12)
     """
 
-    E = [-math.sqrt(3.0 / 5.0), 0.0, math.sqrt(3.0 / 5.0)]
-    W = [(5.0 / 9.0), (8.0 / 9.0), (5.0 / 9.0)]
-
-    tbegin = -1
-    tend = 1
-    intervals_per_hour = 1
-
-    nsplits = (tend - tbegin) * intervals_per_hour
-
-    time_steps = np.append(np.arange(tbegin, tend), tend)
-
-    integral = lat * 0
-
-    for s in range(len(time_steps) - 1): 
-        ti = time_steps[s]
-        tf = time_steps[s + 1]
-        deltat = tf - ti
-        jacob = deltat / 2
-        w = jacob * np.array(W)           # note case sensitivity of w
-        t = jacob * np.array(E)
-        t = t + ((tf + ti) / 2)
-
-        for n in range(len(w)):
-            cza = calc_cza(lat = lat,
-                           lon = lon,
-                           y = y,
-                           mon = mon,
-                           d = d,
-                           hr = hr + t[n])
-            integral = integral + w[n] * cza
-    
-    return integral / 2
+    # Evaluate cza at all quadrature nodes at once along a trailing axis; the
+    # time-dependent terms are cached for a scalar hour
+    if np.ndim(hr) == 0:
+        d_rad, sha0 = _node_time_terms(y, mon, d, round(hr, 5))
+    else:
+        d_rad, sha0 = _solar_time_terms(y, mon, d, np.expand_dims(hr, -1) + _OFFSETS)
+
+    cza = _cza(np.expand_dims(lat, -1), np.expand_dims(lon, -1), d_rad, sha0)
+
+    return np.dot(cza, _WEIGHTS) / 2
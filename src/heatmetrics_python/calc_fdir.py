@@ -1,6 +1,5 @@
-import math
-from . import solarposition
-from .solarposition import solarposition
+import numpy as np
+from .solarposition import _solarposition_fields
 
 def calc_fdir(year, month, day, lat, lon, solar, cza):
     """Calculate fraction of solar irradiance due to direct beam (FDIR)
@@ -15,59 +14,43 @@ def calc_fdir(year, month, day, lat, lon, solar, cza):
 	    fractional day based on time, e.g., 4.5 = noon UTC on the 4th of the month.
     :type day: float
     :param lat: Degrees north latitude (-90 to 90)
-    :type lat: float
+    :type lat: float or numpy.ndarray
     :param lon: Degrees east longitude (-180 to 180)
-    :type lon: float
+    :type lon: float or numpy.ndarray
     :param solar: Total surface solar irradiance (W/m2)
-    :type solar: float
+    :type solar: float or numpy.ndarray
     :param cza: Cosine solar zenith angle (0-1)
-    :type cza: float
+    :type cza: float or numpy.ndarray
     :returns: the fraction of irradiance due to direct beam ("fdir").
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: calc_fdir(2020, 7, 4, 30, -100, 600, 0.5)
     """
 
     # DEFAULTS ____________________________________________________________________
     days_1900 = 0.0
-    solarRet = solar
-    fdir = 0
 
     # CONSTANTS ___________________________________________________________________
     SOLAR_CONST = 1367.0
-    DEG_RAD = 0.017453292519943295
     CZA_MIN = 0.00873
     NORMSOLAR_MAX = 0.85
 
-    solarposObj = solarposition(year, month, day, days_1900, lat, lon)
-    elev = solarposObj['altitude']
-    soldist = solarposObj['distance']
-
-    toasolar = SOLAR_CONST * max(0, cza) / (soldist * soldist)
+    soldist, = _solarposition_fields(year, month, day, days_1900, lat, lon, 'distance')
 
     #  If the sun is not fully above the horizon, then
     #  set the maximum (top of atmosphere [TOA]) solar = 0
 
-    if cza < CZA_MIN:
-        toasolar = 0 
-
-    if toasolar > 0: 
+    toasolar = np.where(cza < CZA_MIN, 0.0, SOLAR_CONST * np.maximum(cza, 0) / (soldist * soldist))
 
-        #  Account for any solar sensor calibration errors and
-        #  make the solar irradiance consistent with normsolar
+    #  Account for any solar sensor calibration errors and
+    #  make the solar irradiance consistent with normsolar.
+    #  Cells with no TOA solar are given a placeholder divisor and masked below
 
-        normsolar = min(solar / toasolar, NORMSOLAR_MAX)
-        solarRet = normsolar * toasolar
+    normsolar = np.minimum(solar / np.where(toasolar > 0, toasolar, 1.0), NORMSOLAR_MAX)
 
-        #  calculate fraction of the solar irradiance due to the direct beam
+    #  calculate fraction of the solar irradiance due to the direct beam;
+    #  it is 0 wherever there is no TOA solar or no normalized solar
 
-        if normsolar > 0:
-            fdir = math.exp(3 - 1.34 * normsolar - 1.65 / normsolar)
-            fdir = max(min(fdir, 0.9), 0.0)
-        else:
-            fdir = 0
-            cza = 0                       # added "cza <- 0"
-    else:
-        fdir = 0 
-        cza = 0                          # added "cza <- 0"
+    fdir = np.exp(3 - 1.34 * normsolar - 1.65 / np.where(normsolar > 0, normsolar, 1.0))
+    fdir = np.clip(fdir, 0.0, 0.9)
 
-    return fdir
+    return np.where((toasolar > 0) & (normsolar > 0), fdir, 0.0)[()]
@@ -1,4 +1,7 @@
-import math
+import numpy as np
+
+DEG_RAD = np.pi / 180       # degrees to radians
+YEAR_FRAC = 360 / 365.25    # degrees of the annual cycle per day
 
 def calc_solarDA(jd, hour):
     """Calculate solar declination angle
@@ -6,30 +9,36 @@ def calc_solarDA(jd, hour):
     This function calculates the solar declination angle ("d") in degrees and time correction ("tc").
 
     :param jd: Julian day of year (1-366, e.g., Feb. 1 = 32)
-    :type jd: int
+    :type jd: int or numpy.ndarray
     :param hour: Hour (0-23 UTC)
-    :type hour: int
-    :returns: a dictionary of outputs: solar declination angle ("d") and time offset ("tc").
-    :rtype: dict
+    :type hour: float or numpy.ndarray
+    :returns: a tuple of outputs: solar declination angle (d) and time offset (tc).
+    :rtype: tuple
     :examples calc_solarDA(40, 12)
     """
 
     # Calculate angular fraction of the year in radians
     #
-    g = (360 / 365.25) * (jd + (hour / 24))  # fractional year g in degrees
+    g = YEAR_FRAC * (jd + (hour / 24))  # fractional year g in degrees
     
-    if g > 360:
-        g = g - 360
+    g = np.where(g > 360, g - 360, g)
+
+    g_rad =  g * DEG_RAD # convert to radians
 
-    g_rad =  g * (math.pi / 180) # convert to radians
+    # Harmonics of g from cos(g) and sin(g) by the angle-addition formulas
+    #
+    cos_g = np.cos(g_rad)
+    sin_g = np.sin(g_rad)
+    cos_2g = cos_g * cos_g - sin_g * sin_g
+    sin_2g = 2 * sin_g * cos_g
+    cos_3g = cos_2g * cos_g - sin_2g * sin_g
+    sin_3g = sin_2g * cos_g + cos_2g * sin_g
 
     # Calculate the solar declination angle, lowercase delta, in degrees:
     #
-    d = 0.396372 - 22.91327 * math.cos(g_rad) + 4.025430 * math.sin(g_rad) - 0.387205 * math.cos(2 * g_rad) + 0.051967 * math.sin(2 * g_rad) - 0.154527 * math.cos(3 * g_rad) + 0.084798 * math.sin(3 * g_rad)
+    d = 0.396372 - 22.91327 * cos_g + 4.025430 * sin_g - 0.387205 * cos_2g + 0.051967 * sin_2g - 0.154527 * cos_3g + 0.084798 * sin_3g
 
-    tc = (0.004297 + 0.107029 * math.cos(g_rad) - 1.837877 * math.sin(g_rad) -
-           0.837378 * math.cos(2 * g_rad) - 2.340475 * math.sin(2 * g_rad))
+    tc = (0.004297 + 0.107029 * cos_g - 1.837877 * sin_g -
+           0.837378 * cos_2g - 2.340475 * sin_2g)
 
-    outputs = {"d": d, "tc": tc}
-  
-    return outputs
\ No newline at end of file
+    return d, tc
\ No newline at end of file
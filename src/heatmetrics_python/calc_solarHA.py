@@ -1,5 +1,8 @@
-import datetime
 import math
+from . import daynum
+from .daynum import daynum
+
+YEAR_FRAC_RAD = (2 * math.pi) / 365.25    # radians of the annual cycle per day
 
 def calc_solarHA(year, month, day, hour, lon):
     """Calculate solar hour angle
@@ -23,17 +26,23 @@ def calc_solarHA(year, month, day, hour, lon):
 
     # Calculate Julian Day; note index starts at 0
     #
-    dt = datetime.datetime.strptime(f"{month:02d}-{day:02d}-{year:04d}", "%m-%d-%Y")
-    jd = int(dt.strftime("%j")) - 1
+    jd = daynum(year, month, day) - 1
  
     # Calculate angular fraction of the year in radians
     #
-    g = ((2 * math.pi)/365.25) * (jd + (hour / 24))
+    g = YEAR_FRAC_RAD * (jd + (hour / 24))
+
+    # Harmonics of g from cos(g) and sin(g) by the angle-addition formulas
+    #
+    cos_g = math.cos(g)
+    sin_g = math.sin(g)
+    cos_2g = cos_g * cos_g - sin_g * sin_g
+    sin_2g = 2 * sin_g * cos_g
 
     # Calculate the time correction, in radians
     #
-    tc = (0.004297 + (0.107029 * math.cos(g)) - (1.837877 * math.sin(g)) -
-           (0.837378 * math.cos(2*g)) - (2.340475 * math.sin(2*g)))
+    tc = (0.004297 + (0.107029 * cos_g) - (1.837877 * sin_g) -
+           (0.837378 * cos_2g) - (2.340475 * sin_2g))
 
     # Calculate the solar hour angle, in degrees
     #
@@ -1,7 +1,9 @@
 import numpy as np
-import math
-from . import solarposition
-from .solarposition import solarposition
+from collections import namedtuple
+from .solarposition import _solarposition_fields
+
+
+SolarParameters = namedtuple("SolarParameters", ["solarRet", "cza", "fdir"])
 
 
 def calc_solar_parameters(year, month, day, lat, lon, solar, cza, fdir):
@@ -19,17 +21,17 @@ def calc_solar_parameters(year, month, day, lat, lon, solar, cza, fdir):
 	    fractional day based on time, e.g., 4.5 = noon UTC on the 4th of the month.
     :type day: float
     :param lat: Degrees north latitude (-90 to 90)
-    :type lat: float
+    :type lat: float or numpy.ndarray
     :param lon: Degrees east longitude (-180 to 180)
-    :type lon: float
+    :type lon: float or numpy.ndarray
     :param solar: Total surface solar irradiance (W/m2)
-    :type solar: float
+    :type solar: float or numpy.ndarray
     :param cza: Cosine solar zenith angle (0-1); optional (supply "NA" if unknown)
-    :type cza: float
+    :type cza: float or numpy.ndarray
     :param fdir: Fraction of the surface solar radiation from direct (0-1); optional (supply "NA" if unknown)
-    :type fdir: float
-    :returns: a dictionary of outputs: adjusted solar radiation ("solarRet"), cosine of the solar zenith angle ("cza", unchanged if user-supplied), and the fraction of irradiance due to direct beam ("fdir", unchanged if user-supplied).
-    :rtype: dict
+    :type fdir: float or numpy.ndarray
+    :returns: a named tuple of outputs: adjusted solar radiation (solarRet), cosine of the solar zenith angle (cza, unchanged if user-supplied), and the fraction of irradiance due to direct beam (fdir, unchanged if user-supplied).
+    :rtype: SolarParameters
     :examples: calc_solar_parameters(2020, 7, 4, 30, -100, 600, 0.5, 0.5)
     """
 
@@ -43,44 +45,34 @@ def calc_solar_parameters(year, month, day, lat, lon, solar, cza, fdir):
     CZA_MIN = 0.00873
     NORMSOLAR_MAX = 0.85
 
-    solarposObj = solarposition(year, month, day, days_1900, lat, lon)
-    ap_ra = solarposObj['ap_ra']
-    ap_dec = solarposObj['ap_dec']
-    elev = solarposObj['altitude']
-    refr = solarposObj['refraction']
-    azim = solarposObj['azimuth']
-    soldist = solarposObj['distance']
+    elev, soldist = _solarposition_fields(year, month, day, days_1900, lat, lon, 'altitude', 'distance')
 
-    if np.isnan(cza):
-        cza = math.cos((90 - elev) * DEG_RAD)  # if user does not supply cza
+    cza = np.where(np.isnan(cza), np.cos((90 - elev) * DEG_RAD), cza)  # if user does not supply cza
 
-    toasolar = SOLAR_CONST * max(0, cza) / (soldist * soldist) # "Smax" in Liljegren (Eqn. 14, p. 648)
+    toasolar = SOLAR_CONST * np.maximum(cza, 0) / (soldist * soldist) # "Smax" in Liljegren (Eqn. 14, p. 648)
 
-    cza = 0 if cza < 0 else cza   # Added this line
+    cza = np.maximum(cza, 0)   # Added this line
 
     #  If the sun is not fully above the horizon, then
     #  set the maximum (top of atmosphere [TOA]) solar = 0
 
-    if cza < CZA_MIN:
-        toasolar = 0 
+    toasolar = np.where(cza < CZA_MIN, 0.0, toasolar)
+    has_toa = toasolar > 0
 
-    if toasolar > 0:
-        #  Account for any solar sensor calibration errors and
-        #  make the solar irradiance consistent with normsolar
+    #  Account for any solar sensor calibration errors and
+    #  make the solar irradiance consistent with normsolar.
+    #  Cells with no TOA solar keep their inputs unchanged
 
-        normsolar = min(solar / toasolar, NORMSOLAR_MAX )  # S* in Liljegren, Eqn. 13 (p. 648)
-        solarRet = normsolar * toasolar
+    normsolar = np.minimum(solar / np.where(has_toa, toasolar, 1.0), NORMSOLAR_MAX)  # S* in Liljegren, Eqn. 13 (p. 648)
+    solarRet = np.where(has_toa, normsolar * toasolar, solarRet)
 
-        #  calculate fraction of the solar irradiance due to the direct beam
-        if normsolar > 0: 
-            if np.isnan(fdir):
-                fdir = math.exp(3 - 1.34 * normsolar - 1.65 / normsolar) 
-            else:
-                fdir = max(min(fdir, 0.9), 0.0)
-        else:
-            fdir = 0
-            cza = 0                          # added "cza = 0"
+    #  calculate fraction of the solar irradiance due to the direct beam;
+    #  where normsolar is not positive, fdir = 0 and cza = 0
 
-    sp = {"solarRet": solarRet, "cza": cza, "fdir":fdir}
-    return sp
+    fdir_calc = np.exp(3 - 1.34 * normsolar - 1.65 / np.where(normsolar > 0, normsolar, 1.0))
+    fdir_lit = np.where(np.isnan(fdir), fdir_calc, np.clip(fdir, 0.0, 0.9))
+    dark = has_toa & ~(normsolar > 0)
+    fdir = np.where(dark, 0.0, np.where(has_toa, fdir_lit, fdir))
+    cza = np.where(dark, 0.0, cza)                          # added "cza = 0"
 
+    return SolarParameters(solarRet[()], cza[()], fdir[()])
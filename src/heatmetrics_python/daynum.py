@@ -1,3 +1,8 @@
+import numpy as np
+
+# Day of year preceding the first of each month in a non-leap year
+_BEGMONTH = np.array([0,31,59,90,120,151,181,212,243,273,304,334])
+
 def daynum(year, month, day):
 	"""Calculate day number of year
 
@@ -8,32 +13,30 @@ def daynum(year, month, day):
 	A value of -1 is returned if the year is out of bounds.
 
 	:param year: 4-digit year
-	:type year: int
-	:param month: Number of month (1-12)
-	:type month: int
+	:type year: int or numpy.ndarray
+	:param month: Number of month (1-12); float months are truncated to integers
+	:type month: int or numpy.ndarray
 	:param day: Day of month
-	:type day: int
-	:returns: the day of year, i.e., "y-day" (1-366)
-	:rtype: int
+	:type day: int or numpy.ndarray
+	:returns: the day of year, i.e., "y-day" (1-366). Scalar inputs give an int
+	    (a float if day is fractional) and array inputs give a numpy.ndarray
+	:rtype: int or numpy.ndarray
 	:examples: daynum(2020, 7, 4)
 	"""
 
-	# There is no year 0 in the Gregorian calendar and the leap year cycle
-	# changes for earlier years.
-	if year < 1:
-		return -1
-
 	# Leap years (LY) are divisible by 4, except for centurial years not divisible by 400.
 	# Examples of LY: 1996, 2000, 2004; 1896, *NOT* 1900, 1904
 	# 1900 is NOT a leap year because it is a centurial year that is not divisible by 400, unlike 2000.
-	leapyr = 0 # default is non-leap year
-	if ((year % 4) == 0 and (year % 100) != 0) or ((year % 400) == 0):
-		leapyr = 1 
+	leapyr = (((year % 4) == 0) & ((year % 100) != 0)) | ((year % 400) == 0)
 
-	begmonth = [0,31,59,90,120,151,181,212,243,273,304,334]
+	dnum = _BEGMONTH[np.asarray(month).astype(int) - 1] + day
+	dnum = np.where(leapyr & (month > 2), dnum + 1, dnum)
 
-	dnum = begmonth[month-1] + day
-	if (leapyr == 1) & (month > 2):
-		dnum = dnum + 1 
+	# There is no year 0 in the Gregorian calendar and the leap year cycle
+	# changes for earlier years.
+	dnum = np.where(year < 1, -1, dnum)
 
-	return dnum
\ No newline at end of file
+	# Scalar inputs give a Python number, as before arrays were supported
+	if dnum.ndim == 0:
+		return dnum.item()
+	return dnum
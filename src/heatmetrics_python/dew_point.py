@@ -1,4 +1,5 @@
-import math
+import numpy as np
+from .esat import _enhancement_factor
 
 def dew_point(e, phase, Pair):
     """Calculate dew-point temperature from pressure
@@ -9,24 +10,29 @@ def dew_point(e, phase, Pair):
     the td() function.
 
     :param e: Vapor pressure in millibars (equivalent to hPa)
-    :type e: float
+    :type e: float or numpy.ndarray
     :param phase: Indicator - 0 for dew point or 1 for frost point
     :type phase: int
     :param Pair: Barometric pressure in millibars (equivalent to hPa)
-    :type Pair: float
+    :type Pair: float or numpy.ndarray
     :returns: the dew-point temperature in units of Kelvin (K)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: dew_point(10, 0, 1014)
     """
 
     if phase == 0:   # Dew point
-        # Calculate same enhancement factor as in function for saturation vapor pressure
-        EF = 1.0007 + (3.46e-6 * Pair)
-        z = math.log(e / (6.1121 * EF))
-        tdk = 273.15 + 240.97 * z / (17.502 - z)
+        # Remove the same enhancement factor as in function for saturation vapor pressure
+        tdk = _dew_point_base(e / _enhancement_factor(Pair))
     else:	            # Frost point
         EF = 1.0003 + (4.18e-6 * Pair)
-        z = math.log( e / (6.1115 * EF) )
+        z = np.log( e / (6.1115 * EF) )
         tdk = 273.15 + 272.55 * z / (22.452 - z)
 
     return tdk
+
+
+def _dew_point_base(e):
+    """Dew point (K) from a vapor pressure (mb) with the enhancement factor already removed"""
+
+    z = np.log(e / 6.1121)
+    return 273.15 + 240.97 * z / (17.502 - z)
@@ -6,11 +6,11 @@ def diffusivity(Tair,Pair):
     To calculate the diffusivity of water vapor in air, m2/s.
 
     :param Tair: Air temperature in Kelvin (K)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :param Pair: Barometric pressure in millibars (equivalent to hPa)
-    :type Pair: float
+    :type Pair: float or numpy.ndarray
     :returns: the diffusivity in units of m2/s
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: diffusivity(290, 1014)
     """
 
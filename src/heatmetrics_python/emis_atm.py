@@ -8,15 +8,24 @@ def emis_atm(Tair, rh, pres):
 	calculation of globe temperature.
 
 	:param Tair: Air temperature in Kelvin (K)
-	:type Tair: float
+	:type Tair: float or numpy.ndarray
 	:param rh: Relative humidity as a proportion between 0 and 1
-	:type rh: float
+	:type rh: float or numpy.ndarray
 	:param pres: Barometric pressure in millibars (equivalent to hPa)
-	:type pres: float
+	:type pres: float or numpy.ndarray
 	:returns: the atmospheric emissivity
-	:rtype: float
+	:rtype: float or numpy.ndarray
 	:examples: emis_atm(290, 0.65, 1013)
 	"""
 
 	eee = rh * esat(Tair, 0, pres)
+	return _emis_atm(eee)
+
+
+def _emis_atm(eee):
+	"""Atmospheric emissivity from the vapor pressure in millibars
+
+	For callers that already have the vapor pressure; see emis_atm().
+	"""
+
 	return 0.575 * (eee ** 0.143)
@@ -1,4 +1,4 @@
-import math
+import numpy as np
 
 def esat(tk, phase, Pair):
     """Saturation vapor pressure
@@ -7,24 +7,36 @@ def esat(tk, phase, Pair):
     (phase = 0) or ice (phase = 1).
 
     :param tk: Air temperature in Kelvin (K)
-    :type tk: float
+    :type tk: float or numpy.ndarray
     :param phase: Over liquid water (0) or ice (1)
     :type phase: int
     :param Pair: Barometric pressure in millibars (equivalent to hPa)
-    :type Pair: float
+    :type Pair: float or numpy.ndarray
     :returns the saturation vapor pressure in millibars (equivalent to hPa).
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: esat(293, 0, 1014)
     """
 
     if phase == 0:
-        y = (tk - 273.15) / (tk - 32.18)
-        es = 6.1121 * math.exp(17.502 * y)
+        es = _esat_base(tk)
         # Apply "enhancement factor" to correct estimate for moist air:
-        es = (1.0007 + (3.46e-6 * Pair)) * es 
+        es = _enhancement_factor(Pair) * es
     else:			# over ice
         y = (tk - 273.15)/(tk - 0.6)
-        es = 6.1115 * math.exp(22.452 * y)
+        es = 6.1115 * np.exp(22.452 * y)
         es = (1.0003 + (4.18e-6 * Pair)) * es
 
     return es
+
+
+def _esat_base(tk):
+    """Saturation vapor pressure (mb) over liquid water, without the enhancement factor"""
+
+    y = (tk - 273.15) / (tk - 32.18)
+    return 6.1121 * np.exp(17.502 * y)
+
+
+def _enhancement_factor(Pair):
+    """Enhancement factor correcting the saturation vapor pressure over water for moist air"""
+
+    return 1.0007 + (3.46e-6 * Pair)
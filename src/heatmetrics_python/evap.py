@@ -5,9 +5,9 @@ def evap(Tair):
     Also known as the heat of vaporization or enthalpy of vaporization.
 
     :param Tair: Air temperature in Kelvin (K)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :returns: the heat of evaporation in J/kg.
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: evap(293)
     """
 
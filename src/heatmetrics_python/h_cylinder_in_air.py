@@ -1,7 +1,6 @@
-﻿from . import viscosity
-from .viscosity import viscosity
-from . import thermal_cond
-from .thermal_cond import thermal_cond
+﻿from .viscosity import viscosity
+from .thermal_cond import _K_COEF
+import numpy as np
 
 def h_cylinder_in_air(diameter, length, Tair, Pair, speed):
     """Convective heat transfer coefficient (cylinder)
@@ -14,16 +13,26 @@ def h_cylinder_in_air(diameter, length, Tair, Pair, speed):
     :param length: Cylinder length (m)
     :type length: float
     :param Tair: Air temperature (K)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :param Pair: Barometric pressure in millibars (equivalent to hPa)
-    :type Pair: float
+    :type Pair: float or numpy.ndarray
     :param speed: Wind speed (m/s)
-    :type speed: float
+    :type speed: float or numpy.ndarray
     :returns: the convective heat transfer coefficient in units of W/(m2⋅K)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: h_cylinder_in_air(0.007, 0.0254, 290, 1014, 3)
     """
 
+    return _h_cylinder_in_air(diameter, length, Tair, Pair, speed)[0]
+
+
+def _h_cylinder_in_air(diameter, length, Tair, Pair, speed):
+    """Convective heat transfer coefficient (cylinder), with air properties
+
+    Same as h_cylinder_in_air(), but also returns the air density (kg/m3) and
+    viscosity (kg/(m⋅s)) computed along the way, for callers that need them too.
+    """
+
     # CONSTANTS ___________________________________________________________________
     a = 0.56
     b = 0.281
@@ -36,7 +45,8 @@ def h_cylinder_in_air(diameter, length, Tair, Pair, speed):
     Pr = (Cp / (Cp + 1.25 * R_AIR))
 
     density = Pair * 100 / (R_AIR * Tair)
-    Re = max(speed, MIN_SPEED) * density * diameter / viscosity(Tair)
+    mu = viscosity(Tair)
+    Re = np.maximum(speed, MIN_SPEED) * density * diameter / mu
     Nu = b * (Re ** (1 - c)) * (Pr ** (1 - a))
-    return Nu * thermal_cond(Tair) / diameter
+    return Nu * (_K_COEF * mu) / diameter, density, mu   # _K_COEF * mu is thermal_cond(Tair)
 
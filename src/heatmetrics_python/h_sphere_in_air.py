@@ -1,8 +1,17 @@
-﻿from . import viscosity
-from .viscosity import viscosity
-from . import thermal_cond
-from .thermal_cond import thermal_cond
-import math
+﻿from .viscosity import viscosity
+from .thermal_cond import _K_COEF
+import numpy as np
+
+# CONSTANTS ___________________________________________________________________
+_R_GAS = 8314.34
+_M_AIR = 28.97
+_R_AIR = (_R_GAS / _M_AIR)
+_MIN_SPEED = 0.5   # originally was 0.13 m/s
+_Cp = 1003.5
+_Pr = (_Cp / (_Cp + 1.25 * _R_AIR))
+# Coefficient of sqrt(Re) in the Nusselt number. The exponent is kept at 0.3333,
+# as in Liljegren et al., rather than 1/3 so results are unchanged.
+_NU_COEF = 0.6 * _Pr ** 0.3333
 
 
 def h_sphere_in_air(diameter, Tair, Pair, speed):
@@ -14,32 +23,27 @@ def h_sphere_in_air(diameter, Tair, Pair, speed):
     :param diameter: Sphere diameter (m)
     :type diameter: float 
     :param Tair: Air temperature (K)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :param Pair: Barometric pressure in millibars (equivalent to hPa)
-    :type Pair: float
+    :type Pair: float or numpy.ndarray
     :param speed: Wind speed (m/s)
-    :type speed: float
+    :type speed: float or numpy.ndarray
     :returns: the convective heat transfer coefficient in units of W/(m2⋅K)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: h_sphere_in_air(0.0508, 290, 1014, 3)
     """
 
-    # CONSTANTS ___________________________________________________________________
-    R_GAS = 8314.34
-    M_AIR = 28.97
-    R_AIR = (R_GAS / M_AIR)
-    MIN_SPEED = 0.5   # originally was 0.13 m/s
-    Cp = 1003.5
-    Pr = (Cp / (Cp + 1.25 * R_AIR))
+    density = Pair * 100 / ( _R_AIR * Tair )
 
-    density = Pair * 100 / ( R_AIR * Tair )
+    # Viscosity is shared by the Reynolds number and the thermal conductivity
+    mu = viscosity(Tair)
 
     # Calculate Reynolds Number (Re)
-    Re = max(speed, MIN_SPEED) * density * diameter / viscosity(Tair)
+    Re = np.maximum(speed, _MIN_SPEED) * density * diameter / mu
 
     # Calculate Nusselt Number (Nu)
-    Nu = 2.0 + 0.6 * math.sqrt(Re) * (Pr ** 0.3333)
+    Nu = 2.0 + _NU_COEF * np.sqrt(Re)
 
-    return Nu * thermal_cond(Tair) / diameter
+    return Nu * (_K_COEF * mu) / diameter   # _K_COEF * mu is thermal_cond(Tair)
 
 
@@ -1,4 +1,4 @@
-import math
+import numpy as np
 
 def humidex(t, td):
 	"""Humidex
@@ -11,13 +11,13 @@ def humidex(t, td):
 	(2001) [https://doi.org/10.1289/ehp.011091241] and references therein.
 
 	:param t: Ambient temperature (deg. C)
-	:type t: float
+	:type t: float or numpy.ndarray
 	:param td: Dew-point temperature (deg. C)
-	:type td: float
+	:type td: float or numpy.ndarray
 	:returns: the humidex in degrees Celsius.
-	:rtype: float
+	:rtype: float or numpy.ndarray
 	:examples: humidex(30, 26)
 	"""
 
-	hx = (t + (5/9) * ((6.1094 * math.exp((17.625 * td) / (243.04 + td))) - 10))
+	hx = (t + (5/9) * ((6.1094 * np.exp((17.625 * td) / (243.04 + td))) - 10))
 	return hx
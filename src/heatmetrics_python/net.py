@@ -6,13 +6,13 @@ def net(t, RH, ws):
 	[https://doi.org/10.1017/S1350482700001602] and references therein.
 
 	:param t: Ambient temperature (deg. C)
-	:type t: float
+	:type t: float or numpy.ndarray
 	:param RH: Relative humidity (\%)
-	:type RH: float
+	:type RH: float or numpy.ndarray
 	:param ws: Wind speed (m/s)
-	:type ws: float
+	:type ws: float or numpy.ndarray
 	:returns: the net effective temperature in degrees Celsius.
-	:rtype: float
+	:rtype: float or numpy.ndarray
 	:examples: net(30, 75, 2)
 	"""
 
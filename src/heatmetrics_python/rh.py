@@ -1,4 +1,3 @@
-import math
 import numpy as np
 
 def rh(t, q, p):
@@ -7,13 +6,13 @@ def rh(t, q, p):
     Returns the relative humidity in percent (\%)
 
     :param t: temperature (*C)
-    :type t: float
+    :type t: float or numpy.ndarray
     :param q: specific humidity (kg/kg)
-    :type q: float
+    :type q: float or numpy.ndarray
     :param p: barometric pressure (Pa)
-    :type p: float
+    :type p: float or numpy.ndarray
     :returns: relative humidity (\%)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: rh(31, 0.0197, 101300)
     """
 
@@ -23,18 +22,14 @@ def rh(t, q, p):
     a3 = 243.04 # *C
 
     # Saturation vapor pressure
-    es = a1 * math.exp((a2 * t) / (a3 + t))
+    es = a1 * np.exp((a2 * t) / (a3 + t))
 
     RH = 100 * ((-q / ((q-1))) /
                  ((0.622 * es) / (p - es)))
 
     # Adjust for small excess at upper extreme,
-    # otherwise return NaN
-    if RH < 0 or RH > 105:
-        return np.nan # Representing NA with NaN
-    elif RH > 100:
-        return 100
-    else:
-        return RH
+    # otherwise return NaN (representing NA)
+    RH = np.where((RH < 0) | (RH > 105), np.nan, np.minimum(RH, 100))
+    return RH[()]
   
  
\ No newline at end of file
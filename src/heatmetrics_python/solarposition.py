@@ -1,6 +1,20 @@
 import math
+import numpy as np
+from functools import lru_cache
 from . import daynum 
 from .daynum import daynum
+from .solarposition_batch import solarposition_batch, _GMST0, _GMST1, _GMST2, _GMST3
+
+# Standard atmosphere assumed by the refraction correction
+_TEMP = 15                    # Earth mean atmospheric temperature at sea level, deg C
+_PRESSURE = 1013.25           # Earth mean atmospheric pressure at sea level, hPa (equivalent to mb)
+_P_OVER_TT = _PRESSURE / (273.0 + _TEMP)
+
+
+def _wrap(x, period):
+    """Put x in the range 0 -> period"""
+    r = math.fmod(x, period)
+    return r + period if r < 0 else r
 
 
 def solarposition(year, month, day, days_1900, latitude, longitude):
@@ -73,7 +87,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
     # daynumber       | Sequential daynumber during a year.
     # delta_days      | Whole days since 2000 January 0.
     # delta_years     | Whole years since 2000.
-    # cent_J2000      | Julian centuries since epoch J2000.0 at 0h UT.
+    # days_0h         | Days since epoch J2000.0 at 0h UT.
     # cos_alt         | Cosine of the altitude of Sun.
     # cos_apdec       | Cosine of the apparent declination of Sun.
     # cos_az          | Cosine of the azimuth of Sun.
@@ -90,13 +104,14 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
     # mean_obliquity  | Mean obliquity of the ecliptic.
     # sin_apdec       | Sine of the apparent declination of Sun.
     # sin_az          | Sine of the azimuth of Sun.
+    # sin_el          | Sine of the solar ecliptic longitude.
     # sin_lat         | Sine of the site latitude.
+    # sin_lha         | Sine of the local apparent hour angle of Sun.
+    # sin_ma, cos_ma  | Sine and cosine of the Earth mean anomaly.
     # tan_alt         | Tangent of the altitude of Sun.
     # ut              | UT hours since midnight.
 
     # CONSTANTS _______________________________________________________________
-    temp = 15                    # Earth mean atmospheric temperature at sea level, deg C
-    pressure = 1013.25               # Earth mean atmospheric pressure at sea level, hPa (equivalent to mb)
     PI = 3.1415926535897932
     TWOPI = 6.2831853071795864
     DEG_RAD = 0.017453292519943295  # pi/180
@@ -128,7 +143,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
                 return retVal # retVal is still -1
             daynumber = math.floor(day)
 
-        # Construct Julian centuries since J2000 at 0 hours UT of date,
+        # Construct days since J2000 at 0 hours UT of date,
         # days.fraction since J2000, and UT hours.
 
         delta_years = year - 2000
@@ -141,7 +156,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
 
         days_J2000 = delta_days - 1.5
 
-        cent_J2000 = days_J2000 / 36525.0
+        days_0h = days_J2000
 
         integral = math.floor(day)
         ut = day - integral
@@ -155,7 +170,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
             return retVal # retVal is still -1, i.e., error
 
         # Construct days.fraction since J2000, UT hours, and
-        # Julian centuries since J2000 at 0 hours UT of date.
+        # days since J2000 at 0 hours UT of date.
         # days_1900 is 36524 for 2000/01/00. J2000 is 2000/01/01.5
 
         days_J2000 = days_1900 - 36525.5
@@ -163,7 +178,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
         integral = math.floor(days_1900)
         ut = (days_1900 - integral) * 24
 
-        cent_J2000 = (integral - 36525.5) / 36525.0
+        days_0h = integral - 36525.5
 
     # Compute solar position parameters.
     # A.A. (1990, C24)
@@ -173,46 +188,42 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
 
     # Put mean_anomaly and mean_longitude in the range 0 -> 2 pi (from degrees to radians)
 
-    integral = math.floor(mean_anomaly / 360.0)
-    mean_anomaly = (mean_anomaly / 360.0 - integral) * TWOPI
-    integral = math.floor(mean_longitude / 360.0)
-    mean_longitude = (mean_longitude / 360.0 - integral) * TWOPI
+    mean_anomaly = _wrap(mean_anomaly, 360.0) * DEG_RAD
+    mean_longitude = _wrap(mean_longitude, 360.0) * DEG_RAD
+
+    # Each sine/cosine pair below is evaluated once and reused; the 2 * mean_anomaly
+    # terms follow from the double-angle identities.
+    sin_ma = math.sin(mean_anomaly)
+    cos_ma = math.cos(mean_anomaly)
+    sin_2ma = 2.0 * sin_ma * cos_ma
+    cos_2ma = 1.0 - 2.0 * sin_ma * sin_ma
 
     mean_obliquity = (23.439 - 4.0e-7 * days_J2000) * DEG_RAD   # convert to radians
-    ecliptic_long = ((1.915 * math.sin(mean_anomaly)) +
-                      (0.020 * math.sin(2.0 * mean_anomaly))) * DEG_RAD + mean_longitude
+    ecliptic_long = ((1.915 * sin_ma) +
+                      (0.020 * sin_2ma)) * DEG_RAD + mean_longitude
 
-    distance = 1.00014 - 0.01671 * math.cos(mean_anomaly) - 0.00014 * math.cos(2.0 * mean_anomaly)
+    distance = 1.00014 - 0.01671 * cos_ma - 0.00014 * cos_2ma
 
-    # Tangent of ecliptic_long separated into sine and cosine parts for ap_ra.
+    sin_el = math.sin(ecliptic_long)
 
-    ap_ra = math.atan2(math.cos(mean_obliquity) * math.sin(ecliptic_long), math.cos(ecliptic_long))
+    # Tangent of ecliptic_long separated into sine and cosine parts for ap_ra.
 
-    # Change range of ap_ra from -pi -> pi to 0 -> 2 pi
-    if ap_ra < 0.0:
-        ap_ra = ap_ra + TWOPI
+    ap_ra = math.atan2(math.cos(mean_obliquity) * sin_el, math.cos(ecliptic_long))
 
-    # Put ap_ra in the range 0 -> 24 hours.
-    integral = math.floor(ap_ra / TWOPI)
-    ap_ra = (ap_ra / TWOPI - integral) * 24.0
+    # Change range of ap_ra from -pi -> pi to 0 -> 2 pi, then to 0 -> 24 hours.
+    ap_ra = _wrap(ap_ra, TWOPI) / TWOPI * 24.0
 
-    ap_dec = math.asin(math.sin(mean_obliquity) * math.sin(ecliptic_long))
+    ap_dec = math.asin(math.sin(mean_obliquity) * sin_el)
 
     # Calculate local mean sidereal time.
     # A.A. 1990, B6-B7.
 
-    # Horner's method of polynomial exponent expansion used for gmst0h.
-    gmst0h = 24110.54841 + cent_J2000 * (8640184.812866 + cent_J2000 * (0.093104 - cent_J2000 * 6.2e-6))
+    # Horner's method of polynomial exponent expansion used for gmst0h, in hours;
+    # the coefficients absorb the seconds -> hours and days -> centuries scaling.
+    gmst0h = _GMST0 + days_0h * (_GMST1 + days_0h * (_GMST2 + days_0h * _GMST3))
 
-    #Convert gmst0h from seconds to hours and put in the range 0 -> 24.
-    #gmst0h = modf(gmst0h / 3600.0 / 24.0, &integral) * 24.0
-    integral = math.floor(gmst0h/3600/24)
-    if integral < 0:
-        integral = integral + 1  # to match behavior of C modf() when dealing with negative numbers
-    gmst0h = (gmst0h/3600/24 - integral) * 24
-
-    if gmst0h < 0.0:
-        gmst0h <- gmst0h + 24.0
+    # Put gmst0h in the range 0 -> 24.
+    gmst0h = _wrap(gmst0h, 24.0)
 
     # Ratio of lengths of mean solar day to mean sidereal day is 1.00273790934
     # in 1990. Change in sidereal day length is < 0.001 second over a century.
@@ -221,13 +232,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
     lmst = gmst0h + (ut * 1.00273790934) + longitude / 15.0
 
     # Put lmst in the range 0 -> 24 hours.
-    integral = math.floor(lmst/24)
-    if integral < 0:
-        integral = integral + 1  # to match behavior of C modf()
-    lmst = (lmst/24 - integral) * 24
-
-    if lmst < 0.0:
-        lmst = lmst + 24.0
+    lmst = _wrap(lmst, 24.0)
 
     # Calculate local hour angle, altitude, azimuth, and refraction correction.
     # A.A. 1990, B61-B62
@@ -250,6 +255,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
     cos_lat = math.cos(latitude)
     sin_lat = math.sin(latitude)
     cos_lha = math.cos(local_ha)
+    sin_lha = math.sin(local_ha)
 
     altitude = math.asin(sin_apdec * sin_lat + cos_apdec * cos_lha * cos_lat)
 
@@ -264,7 +270,7 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
         tan_alt = 6.0e6
 
     cos_az = (sin_apdec * cos_lat - cos_apdec * cos_lha * sin_lat) / cos_alt
-    sin_az = -(cos_apdec * math.sin(local_ha) / cos_alt)
+    sin_az = -(cos_apdec * sin_lha / cos_alt)
     azimuth = math.acos(cos_az)
 
     #Change range of azimuth from 0 -> pi to 0 -> 2 pi
@@ -292,10 +298,10 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
         refraction = 0.0
     else:
         if altitude < 19.225:
-            refraction = (0.1594 + (altitude) * (0.0196 + 0.00002 * (altitude))) * pressure
-            refraction = refraction / (1.0 + (altitude) * (0.505 + 0.0845 * (altitude))) * (273.0 + temp) 
+            refraction = ((0.1594 + altitude * (0.0196 + 0.00002 * altitude)) * _P_OVER_TT /
+                          (1.0 + altitude * (0.505 + 0.0845 * altitude)))
         else:
-            refraction = 0.00452 * (pressure / (273.0 + temp)) / tan_alt
+            refraction = 0.00452 * _P_OVER_TT / tan_alt
 
     # To match Michalsky's sunae program, the following line was inserted
     # by JC Liljegren to add the refraction correction to the solar altitude
@@ -309,3 +315,26 @@ def solarposition(year, month, day, days_1900, latitude, longitude):
                "altitude": altitude, "ap_dec": ap_dec, "ap_ra": ap_ra}
     return outputs
 
+
+# Memoized solarposition() for callers that evaluate many cells at the same date
+# and location. Callers round the fractional day so that float keys are stable.
+# The returned dictionary is shared between calls and must not be modified.
+_solarposition_cached = lru_cache(maxsize=65536)(solarposition)
+
+
+def _solarposition_fields(year, month, day, days_1900, latitude, longitude, *fields):
+    """Look up solarposition() outputs for scalar or array inputs
+
+    A single date and point goes through the memoized scalar solarposition();
+    arrays of dates and/or points are evaluated in one call to
+    solarposition_batch(). Fields of out-of-bounds inputs are NaN.
+    """
+
+    if all(np.ndim(x) == 0 for x in (year, month, day, days_1900, latitude, longitude)):
+        solarposObj = _solarposition_cached(year, month, round(day, 6), days_1900, latitude, longitude)
+        if solarposObj == -1:
+            # inputs out of bounds; report NaN as solarposition_batch() does
+            return tuple(np.nan for field in fields)
+    else:
+        solarposObj = solarposition_batch(year, month, day, days_1900, latitude, longitude)
+    return tuple(solarposObj[field] for field in fields)
@@ -0,0 +1,205 @@
+import numpy as np
+from .daynum import daynum
+
+# Standard atmosphere assumed by the refraction correction
+_TEMP = 15                    # Earth mean atmospheric temperature at sea level, deg C
+_PRESSURE = 1013.25           # Earth mean atmospheric pressure at sea level, hPa (equivalent to mb)
+_P_OVER_TT = _PRESSURE / (273.0 + _TEMP)
+
+# Greenwich mean sidereal time at 0h UT (A.A. 1990, B6) as a polynomial in days
+# since J2000.0 at 0h UT, in hours; the published coefficients are in seconds
+# and Julian centuries
+_GMST0 = 24110.54841 / 3600.0
+_GMST1 = 8640184.812866 / 36525.0 / 3600.0
+_GMST2 = 0.093104 / 36525.0 ** 2 / 3600.0
+_GMST3 = -6.2e-6 / 36525.0 ** 3 / 3600.0
+
+
+def solarposition_batch(year, month, day, days_1900, latitude, longitude):
+    """Solar position for arrays of dates and locations
+
+    Array version of solarposition(): the inputs are broadcast against each other
+    and every output is evaluated elementwise with NumPy, so N timestamps and/or
+    locations are processed in a single call. Elements whose inputs are out of
+    bounds have retVal = -1 and NaN in every other output.
+
+    :param year: Four-digit year (Gregorian calendar). Use "0" if
+	    reporting date as days since 1900
+    :type year: int or numpy.ndarray
+    :param month: Month number (1-12). Use "0" if reporting date
+	    as year and day of year (yday) -or- days since 1900
+    :type month: int or numpy.ndarray
+    :param day: Fractional day of month (0-32) or day of year (0-367)
+    :type day: float or numpy.ndarray
+    :param days_1900: Days since 1 January 1900 at 00:00:00 UTC
+	    Use "0" if entering date as year, month, and day -or- year & yday
+    :type days_1900: float or numpy.ndarray
+    :param latitude: Degrees north latitude (-90 to 90)
+    :type latitude: float or numpy.ndarray
+    :param longitude: Degrees east longitude (-180 to 180)
+    :type longitude: float or numpy.ndarray
+    :returns: a dictionary of arrays with the same keys as solarposition(): "retVal",
+	    "distance", "azimuth", "refraction", "altitude", "ap_dec", and "ap_ra"
+    :rtype: dict
+    :examples: solarposition_batch(2020, 7, [4, 4.25, 4.5], 0, 42.36, -71.06)
+    """
+
+    # See solarposition() for the description of the inputs, outputs, and
+    # intermediate variables; the steps below follow it one for one.
+
+    # CONSTANTS _______________________________________________________________
+    TWOPI = 6.2831853071795864
+    DEG_RAD = 0.017453292519943295  # pi/180
+    RAD_DEG = 57.295779513082323    # 180/pi
+
+    # The inputs are not broadcast up front: terms that depend only on the date
+    # are evaluated once per date, and only the steps that involve latitude or
+    # longitude expand to the full shape of the output.
+    year, month, latitude, longitude = (np.asarray(x) for x in (year, month, latitude, longitude))
+    day = np.asarray(day, dtype=float)
+    days_1900 = np.asarray(days_1900, dtype=float)
+
+    # If year is not zero then the date is specified by {year, month, day} or
+    # {year, 0, daynumber}; if year is zero then it is specified by days_1900.
+    # Check every input for its proper range.
+
+    by_date = year != 0
+    by_daynumber = month == 0
+
+    valid_day = np.where(by_daynumber, (day >= 0.0) & (day <= 368.0),
+                         (month >= 1) & (month <= 12) & (day >= 0.0) & (day <= 33.0))
+    valid = ((latitude >= -90) & (latitude <= 90) & (longitude >= -180) & (longitude <= 180) &
+             np.where(by_date, (year >= 1950) & (year <= 2049) & valid_day,
+                      (days_1900 >= 18262.0) & (days_1900 <= 54788.0)))
+
+    # Construct days since J2000 at 0 hours UT of date,
+    # days.fraction since J2000, and UT hours.
+
+    integral = np.floor(day)
+    # Months out of range (including NaN) are invalid anyway; give daynum() a placeholder
+    daynum_month = np.where((month >= 1) & (month <= 12), month, 1)
+    daynumber = np.where(by_daynumber, integral, daynum(year, daynum_month, integral))
+
+    # delta_days is days from 2000/01/00 (1900's are negative); J2000 is 2000/01/01.5
+    delta_years = year - 2000
+    delta_days = np.floor(delta_years * 365 + delta_years / 4 + daynumber) + (year > 2000)
+
+    # days_1900 is 36524 for 2000/01/00. A.A. 1990, K2-K4.
+    integral_1900 = np.floor(days_1900)
+
+    days_J2000 = np.where(by_date, delta_days - 1.5 + (day - integral), days_1900 - 36525.5)
+    days_0h = np.where(by_date, delta_days - 1.5, integral_1900 - 36525.5)
+    ut = np.where(by_date, day - integral, days_1900 - integral_1900) * 24.0
+
+    # Compute solar position parameters.
+    # A.A. (1990, C24)
+
+    mean_anomaly = (357.528 + 0.9856003 * days_J2000)
+    mean_longitude = (280.460 + 0.9856474 * days_J2000)
+
+    # Put mean_anomaly and mean_longitude in the range 0 -> 2 pi (from degrees to radians)
+
+    mean_anomaly = np.mod(mean_anomaly, 360.0) * DEG_RAD
+    mean_longitude = np.mod(mean_longitude, 360.0) * DEG_RAD
+
+    sin_ma = np.sin(mean_anomaly)
+    cos_ma = np.cos(mean_anomaly)
+    sin_2ma = 2.0 * sin_ma * cos_ma
+    cos_2ma = 1.0 - 2.0 * sin_ma * sin_ma
+
+    mean_obliquity = (23.439 - 4.0e-7 * days_J2000) * DEG_RAD   # convert to radians
+    ecliptic_long = ((1.915 * sin_ma) +
+                      (0.020 * sin_2ma)) * DEG_RAD + mean_longitude
+
+    distance = 1.00014 - 0.01671 * cos_ma - 0.00014 * cos_2ma
+
+    sin_el = np.sin(ecliptic_long)
+
+    # Tangent of ecliptic_long separated into sine and cosine parts for ap_ra.
+    # Change range of ap_ra from -pi -> pi to 0 -> 2 pi, then to 0 -> 24 hours.
+
+    ap_ra = np.arctan2(np.cos(mean_obliquity) * sin_el, np.cos(ecliptic_long))
+    ap_ra = np.mod(ap_ra, TWOPI) / TWOPI * 24.0
+
+    ap_dec = np.arcsin(np.sin(mean_obliquity) * sin_el)
+
+    # Calculate local mean sidereal time.
+    # A.A. 1990, B6-B7.
+
+    # Horner's method of polynomial exponent expansion used for gmst0h, in hours;
+    # the coefficients absorb the seconds -> hours and days -> centuries scaling.
+    gmst0h = _GMST0 + days_0h * (_GMST1 + days_0h * (_GMST2 + days_0h * _GMST3))
+
+    # Put gmst0h in the range 0 -> 24.
+    gmst0h = np.mod(gmst0h, 24.0)
+
+    # Ratio of lengths of mean solar day to mean sidereal day is 1.00273790934
+    # in 1990. Change in sidereal day length is < 0.001 second over a century.
+    # A. A. 1990, B6.
+
+    lmst = gmst0h + (ut * 1.00273790934) + longitude / 15.0
+
+    # Put lmst in the range 0 -> 24 hours.
+    lmst = np.mod(lmst, 24.0)
+
+    # Calculate local hour angle, altitude, azimuth, and refraction correction.
+    # A.A. 1990, B61-B62
+
+    local_ha = lmst - ap_ra
+
+    # Put hour angle in the range -12 to 12 hours.
+    local_ha = np.where(local_ha < (-12.0), local_ha + 24.0,
+                        np.where(local_ha > 12.0, local_ha - 24.0, local_ha))
+
+    # Convert latitude and local_ha to radians
+    latitude = latitude * DEG_RAD
+    local_ha = local_ha / 24.0 * TWOPI
+
+    cos_apdec = np.cos(ap_dec)
+    sin_apdec = np.sin(ap_dec)
+    cos_lat = np.cos(latitude)
+    sin_lat = np.sin(latitude)
+    cos_lha = np.cos(local_ha)
+    sin_lha = np.sin(local_ha)
+
+    altitude = np.arcsin(sin_apdec * sin_lat + cos_apdec * cos_lha * cos_lat)
+
+    cos_alt = np.cos(altitude)
+
+    # Avoid tangent overflow at altitudes of +-90 degrees.
+    # 1.57079615 radians is equal to 89.99999 degrees.
+
+    tan_alt = np.where(np.abs(altitude) < 1.57079615, np.tan(altitude), 6.0e6)
+
+    cos_az = (sin_apdec * cos_lat - cos_apdec * cos_lha * sin_lat) / cos_alt
+    sin_az = -(cos_apdec * sin_lha / cos_alt)
+    azimuth = np.arccos(cos_az)
+
+    # Change range of azimuth from 0 -> pi to 0 -> 2 pi
+    azimuth = np.where(np.arctan2(sin_az, cos_az) < 0.0, TWOPI - azimuth, azimuth)
+
+    # Convert ap_dec, altitude, and azimuth to degrees
+    ap_dec = ap_dec * RAD_DEG
+    altitude = altitude * RAD_DEG
+    azimuth = azimuth * RAD_DEG
+
+    # Compute refraction correction to be added to altitude to obtain actual position;
+    # see solarposition() for the choice of the 19.225 degree crossover altitude.
+
+    refraction_low = ((0.1594 + altitude * (0.0196 + 0.00002 * altitude)) * _P_OVER_TT /
+                      (1.0 + altitude * (0.505 + 0.0845 * altitude)))
+    refraction_high = 0.00452 * _P_OVER_TT / tan_alt
+    refraction = np.where((altitude < (-1.0)) | (tan_alt == 6.0e6), 0.0,
+                          np.where(altitude < 19.225, refraction_low, refraction_high))
+
+    # To match Michalsky's sunae program, the following line was inserted
+    # by JC Liljegren to add the refraction correction to the solar altitude
+
+    altitude = altitude + refraction
+
+    outputs = {"retVal": np.where(valid, 0, -1), "distance": distance, "azimuth": azimuth,
+               "refraction": refraction, "altitude": altitude, "ap_dec": ap_dec, "ap_ra": ap_ra}
+    for key in outputs:
+        if key != "retVal":
+            outputs[key] = np.where(valid, outputs[key], np.nan)
+    return outputs
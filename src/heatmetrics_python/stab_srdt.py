@@ -1,5 +1,22 @@
 import numpy as np
 
+# Stability class by wind speed class (rows, i) and solar/dT class (columns, j),
+# built once at import and read-only
+_LSRDT = np.array([
+    [1, 1, 2, 4, 0, 5, 6, 0],
+    [1, 2, 3, 4, 0, 4, 5, 0],  # CORRECTED columns 6 & 7 from "5, 6" to "4, 5"
+    [2, 2, 3, 4, 0, 4, 4, 0],
+    [3, 3, 4, 4, 0, 0, 0, 0],
+    [3, 4, 4, 4, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0],
+], dtype=np.int8)
+_LSRDT.setflags(write=False)
+
+# Class boundaries; a value on a boundary belongs to the class above it
+_SOLAR_DAY = np.array([175.0, 675.0, 925.0])
+_SPEED_DAY = np.array([2.0, 3.0, 5.0, 6.0])
+_SPEED_NIGHT = np.array([2.0, 2.5])
+
 def stab_srdt(daytime, speed, solar, dT):
     """Stability class
 
@@ -7,66 +24,24 @@ def stab_srdt(daytime, speed, solar, dT):
     speed from higher-altitude wind speeds.
 
     :param daytime: "1" for daytime, "0" for nighttime
-    :type daytime: int
+    :type daytime: int or numpy.ndarray
     :param speed: Wind speed (m/s)
-    :type speed: float
+    :type speed: float or numpy.ndarray
     :param solar: Irradiance (W/m2)
-    :type solar: float
+    :type solar: float or numpy.ndarray
     :param dT: Temperature differential between wind-speed heights (deg C)
-    :type dT: float
+    :type dT: float or numpy.ndarray
     :returns: the stability class (0-6) used for adjusting wind speeds from
 	    reference height to 2-meter height.
-    :rtype: float
+    :rtype: int or numpy.ndarray
     :examples: stab_srdt(1, 3, 700, -0.052)
     """
 
-    lsrdt = np.zeros((6, 8))
-    lsrdt[0,] = [1, 1, 2, 4, 0, 5, 6, 0]
-    lsrdt[1,] = [1, 2, 3, 4, 0, 4, 5, 0]  # CORRECTED columns 6 & 7 from "5, 6" to "4, 5"
-    lsrdt[2,] = [2, 2, 3, 4, 0, 4, 4, 0]
-    lsrdt[3,] = [3, 3, 4, 4, 0, 0, 0, 0]
-    lsrdt[4,] = [3, 4, 4, 4, 0, 0, 0, 0]
-    lsrdt[5,] = [0, 0, 0, 0, 0, 0, 0, 0]
-
-    if daytime == 1: 
-        if solar >= 925.0:
-            j = 1 
-        else:
-            if solar >= 675.0:
-                j = 2 
-            else:
-                if solar >= 175.0:
-                    j = 3
-                else:
-                    j = 4
- 
-        if speed >= 6.0:
-            i = 5
-        else:
-            if speed >= 5.0:
-                i = 4
-            else:
-                if speed >= 3.0:
-                    i = 3 
-                else:
-                    if speed >= 2.0:
-                        i = 2
-                    else: 
-                        i = 1
-    else:    # NOT daytime
-        if dT >= 0.0:
-            j = 7 
-        else:
-            j = 6
-
-        if speed >= 2.5:
-            i = 3
-        else:
-            if speed >= 2.0:
-                i = 2 
-            else:
-                i = 1 
-
-    return lsrdt[i-1][j-1]
-
+    # Daytime classes come from solar and speed, nighttime classes from dT and speed
+    is_day = np.asarray(daytime) == 1
+    j = np.where(is_day, 4 - np.searchsorted(_SOLAR_DAY, solar, side='right'),
+                 np.where(np.asarray(dT) >= 0.0, 7, 6))
+    i = 1 + np.where(is_day, np.searchsorted(_SPEED_DAY, speed, side='right'),
+                     np.searchsorted(_SPEED_NIGHT, speed, side='right'))
 
+    return _LSRDT[i-1, j-1][()]
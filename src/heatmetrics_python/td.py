@@ -1,4 +1,4 @@
-import math
+import numpy as np
 
 def td(t, RH):
     """Calculate dew point temperature from T & RH
@@ -11,11 +11,11 @@ def td(t, RH):
     Reference: Eqn. 8 in Lawrence (2005, p.226), https://doi.org/10.1175/BAMS-86-2-225
 
     :param t: temperature (*C)
-    :type t: float
+    :type t: float or numpy.ndarray
     :param RH: relative humidity (\%)
-    :type RH: float
+    :type RH: float or numpy.ndarray
     :returns: the dewpoint temperature (*C)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: td(30, 70)
     """
 
@@ -23,8 +23,11 @@ def td(t, RH):
     a1 = 17.625 # dimensionless
     b1 = 243.04 # *C
 
-    td = ((b1 * (math.log(RH / 100) + ((a1 * t) / (b1 + t)))) /
-           (a1 - math.log(RH / 100) - ((a1 * t) / (b1 + t))))
+    # Each term appears in both the numerator and the denominator
+    ln_rh = np.log(RH / 100)
+    at = (a1 * t) / (b1 + t)
+
+    td = (b1 * (ln_rh + at)) / (a1 - ln_rh - at)
 
     return td
 
@@ -1,5 +1,11 @@
-﻿from . import viscosity
-from .viscosity import viscosity
+﻿from .viscosity import viscosity
+
+# CONSTANTS ____________________________________________________________________
+_Cp = 1003.5
+_R_GAS = 8314.34
+_M_AIR = 28.97
+_R_AIR = (_R_GAS / _M_AIR)
+_K_COEF = _Cp + 1.25 * _R_AIR
 
 def thermal_cond(Tair):
     """Thermal conductivity
@@ -9,16 +15,10 @@ def thermal_cond(Tair):
     transfer coefficient.
 
     :param Tair: Air temperature (K)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :returns: the thermal conductivity in units of W/(m⋅K)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: thermal_cond(290)
     """
 
-    # CONSTANTS ________________________________________________________________
-    Cp = 1003.5
-    R_GAS = 8314.34
-    M_AIR = 28.97
-    R_AIR = (R_GAS / M_AIR)
-
-    return (Cp + 1.25 * R_AIR) * viscosity(Tair)
+    return _K_COEF * viscosity(Tair)
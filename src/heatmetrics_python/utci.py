@@ -1,6 +1,252 @@
 import numpy as np
 
-def utci(Tair, e, es, ws, D_Tmrt):
+# Regression terms of Brode et al. (2011), one row per monomial in the same order
+# as the published coefficients: coefficient, then the powers of Tair, ws,
+# D_Tmrt, and e. The full approximation is Tair plus the sum of these terms.
+_UTCI_TERMS = np.array([
+    # coefficient  Tair ws D_Tmrt e
+    [ 6.07562052E-01, 0, 0, 0, 0],
+    [-2.27712343E-02, 1, 0, 0, 0],
+    [ 8.06470249E-04, 2, 0, 0, 0],
+    [-1.54271372E-04, 3, 0, 0, 0],
+    [-3.24651735E-06, 4, 0, 0, 0],
+    [ 7.32602852E-08, 5, 0, 0, 0],
+    [ 1.35959073E-09, 6, 0, 0, 0],
+    [-2.25836520E+00, 0, 1, 0, 0],
+    [ 8.80326035E-02, 1, 1, 0, 0],
+    [ 2.16844454E-03, 2, 1, 0, 0],
+    [-1.53347087E-05, 3, 1, 0, 0],
+    [-5.72983704E-07, 4, 1, 0, 0],
+    [-2.55090145E-09, 5, 1, 0, 0],
+    [-7.51269505E-01, 0, 2, 0, 0],
+    [-4.08350271E-03, 1, 2, 0, 0],
+    [-5.21670675E-05, 2, 2, 0, 0],
+    [ 1.94544667E-06, 3, 2, 0, 0],
+    [ 1.14099531E-08, 4, 2, 0, 0],
+    [ 1.58137256E-01, 0, 3, 0, 0],
+    [-6.57263143E-05, 1, 3, 0, 0],
+    [ 2.22697524E-07, 2, 3, 0, 0],
+    [-4.16117031E-08, 3, 3, 0, 0],
+    [-1.27762753E-02, 0, 4, 0, 0],
+    [ 9.66891875E-06, 1, 4, 0, 0],
+    [ 2.52785852E-09, 2, 4, 0, 0],
+    [ 4.56306672E-04, 0, 5, 0, 0],
+    [-1.74202546E-07, 1, 5, 0, 0],
+    [-5.91491269E-06, 0, 6, 0, 0],
+    [ 3.98374029E-01, 0, 0, 1, 0],
+    [ 1.83945314E-04, 1, 0, 1, 0],
+    [-1.73754510E-04, 2, 0, 1, 0],
+    [-7.60781159E-07, 3, 0, 1, 0],
+    [ 3.77830287E-08, 4, 0, 1, 0],
+    [ 5.43079673E-10, 5, 0, 1, 0],
+    [-2.00518269E-02, 0, 1, 1, 0],
+    [ 8.92859837E-04, 1, 1, 1, 0],
+    [ 3.45433048E-06, 2, 1, 1, 0],
+    [-3.77925774E-07, 3, 1, 1, 0],
+    [-1.69699377E-09, 4, 1, 1, 0],
+    [ 1.69992415E-04, 0, 2, 1, 0],
+    [-4.99204314E-05, 1, 2, 1, 0],
+    [ 2.47417178E-07, 2, 2, 1, 0],
+    [ 1.07596466E-08, 3, 2, 1, 0],
+    [ 8.49242932E-05, 0, 3, 1, 0],
+    [ 1.35191328E-06, 1, 3, 1, 0],
+    [-6.21531254E-09, 2, 3, 1, 0],
+    [-4.99410301E-06, 0, 4, 1, 0],
+    [-1.89489258E-08, 1, 4, 1, 0],
+    [ 8.15300114E-08, 0, 5, 1, 0],
+    [ 7.55043090E-04, 0, 0, 2, 0],
+    [-5.65095215E-05, 1, 0, 2, 0],
+    [-4.52166564E-07, 2, 0, 2, 0],
+    [ 2.46688878E-08, 3, 0, 2, 0],
+    [ 2.42674348E-10, 4, 0, 2, 0],
+    [ 1.54547250E-04, 0, 1, 2, 0],
+    [ 5.24110970E-06, 1, 1, 2, 0],
+    [-8.75874982E-08, 2, 1, 2, 0],
+    [-1.50743064E-09, 3, 1, 2, 0],
+    [-1.56236307E-05, 0, 2, 2, 0],
+    [-1.33895614E-07, 1, 2, 2, 0],
+    [ 2.49709824E-09, 2, 2, 2, 0],
+    [ 6.51711721E-07, 0, 3, 2, 0],
+    [ 1.94960053E-09, 1, 3, 2, 0],
+    [-1.00361113E-08, 0, 4, 2, 0],
+    [-1.21206673E-05, 0, 0, 3, 0],
+    [-2.18203660E-07, 1, 0, 3, 0],
+    [ 7.51269482E-09, 2, 0, 3, 0],
+    [ 9.79063848E-11, 3, 0, 3, 0],
+    [ 1.25006734E-06, 0, 1, 3, 0],
+    [-1.81584736E-09, 1, 1, 3, 0],
+    [-3.52197671E-10, 2, 1, 3, 0],
+    [-3.36514630E-08, 0, 2, 3, 0],
+    [ 1.35908359E-10, 1, 2, 3, 0],
+    [ 4.17032620E-10, 0, 3, 3, 0],
+    [-1.30369025E-09, 0, 0, 4, 0],
+    [ 4.13908461E-10, 1, 0, 4, 0],
+    [ 9.22652254E-12, 2, 0, 4, 0],
+    [-5.08220384E-09, 0, 1, 4, 0],
+    [-2.24730961E-11, 1, 1, 4, 0],
+    [ 1.17139133E-10, 0, 2, 4, 0],
+    [ 6.62154879E-10, 0, 0, 5, 0],
+    [ 4.03863260E-13, 1, 0, 5, 0],
+    [ 1.95087203E-12, 0, 1, 5, 0],
+    [-4.73602469E-12, 0, 0, 6, 0],
+    [ 5.12733497E+00, 0, 0, 0, 1],
+    [-3.12788561E-01, 1, 0, 0, 1],
+    [-1.96701861E-02, 2, 0, 0, 1],
+    [ 9.99690870E-04, 3, 0, 0, 1],
+    [ 9.51738512E-06, 4, 0, 0, 1],
+    [-4.66426341E-07, 5, 0, 0, 1],
+    [ 5.48050612E-01, 0, 1, 0, 1],
+    [-3.30552823E-03, 1, 1, 0, 1],
+    [-1.64119440E-03, 2, 1, 0, 1],
+    [-5.16670694E-06, 3, 1, 0, 1],
+    [ 9.52692432E-07, 4, 1, 0, 1],
+    [-4.29223622E-02, 0, 2, 0, 1],
+    [ 5.00845667E-03, 1, 2, 0, 1],
+    [ 1.00601257E-06, 2, 2, 0, 1],
+    [-1.81748644E-06, 3, 2, 0, 1],
+    [-1.25813502E-03, 0, 3, 0, 1],
+    [-1.79330391E-04, 1, 3, 0, 1],
+    [ 2.34994441E-06, 2, 3, 0, 1],
+    [ 1.29735808E-04, 0, 4, 0, 1],
+    [ 1.29064870E-06, 1, 4, 0, 1],
+    [-2.28558686E-06, 0, 5, 0, 1],
+    [-3.69476348E-02, 0, 0, 1, 1],
+    [ 1.62325322E-03, 1, 0, 1, 1],
+    [-3.14279680E-05, 2, 0, 1, 1],
+    [ 2.59835559E-06, 3, 0, 1, 1],
+    [-4.77136523E-08, 4, 0, 1, 1],
+    [ 8.64203390E-03, 0, 1, 1, 1],
+    [-6.87405181E-04, 1, 1, 1, 1],
+    [-9.13863872E-06, 2, 1, 1, 1],
+    [ 5.15916806E-07, 3, 1, 1, 1],
+    [-3.59217476E-05, 0, 2, 1, 1],
+    [ 3.28696511E-05, 1, 2, 1, 1],
+    [-7.10542454E-07, 2, 2, 1, 1],
+    [-1.24382300E-05, 0, 3, 1, 1],
+    [-7.38584400E-09, 1, 3, 1, 1],
+    [ 2.20609296E-07, 0, 4, 1, 1],
+    [-7.32469180E-04, 0, 0, 2, 1],
+    [-1.87381964E-05, 1, 0, 2, 1],
+    [ 4.80925239E-06, 2, 0, 2, 1],
+    [-8.75492040E-08, 3, 0, 2, 1],
+    [ 2.77862930E-05, 0, 1, 2, 1],
+    [-5.06004592E-06, 1, 1, 2, 1],
+    [ 1.14325367E-07, 2, 1, 2, 1],
+    [ 2.53016723E-06, 0, 2, 2, 1],
+    [-1.72857035E-08, 1, 2, 2, 1],
+    [-3.95079398E-08, 0, 3, 2, 1],
+    [-3.59413173E-07, 0, 0, 3, 1],
+    [ 7.04388046E-07, 1, 0, 3, 1],
+    [-1.89309167E-08, 2, 0, 3, 1],
+    [-4.79768731E-07, 0, 1, 3, 1],
+    [ 7.96079978E-09, 1, 1, 3, 1],
+    [ 1.62897058E-09, 0, 2, 3, 1],
+    [ 3.94367674E-08, 0, 0, 4, 1],
+    [-1.18566247E-09, 1, 0, 4, 1],
+    [ 3.34678041E-10, 0, 1, 4, 1],
+    [-1.15606447E-10, 0, 0, 5, 1],
+    [-2.80626406E+00, 0, 0, 0, 2],
+    [ 5.48712484E-01, 1, 0, 0, 2],
+    [-3.99428410E-03, 2, 0, 0, 2],
+    [-9.54009191E-04, 3, 0, 0, 2],
+    [ 1.93090978E-05, 4, 0, 0, 2],
+    [-3.08806365E-01, 0, 1, 0, 2],
+    [ 1.16952364E-02, 1, 1, 0, 2],
+    [ 4.95271903E-04, 2, 1, 0, 2],
+    [-1.90710882E-05, 3, 1, 0, 2],
+    [ 2.10787756E-03, 0, 2, 0, 2],
+    [-6.98445738E-04, 1, 2, 0, 2],
+    [ 2.30109073E-05, 2, 2, 0, 2],
+    [ 4.17856590E-04, 0, 3, 0, 2],
+    [-1.27043871E-05, 1, 3, 0, 2],
+    [-3.04620472E-06, 0, 4, 0, 2],
+    [ 5.14507424E-02, 0, 0, 1, 2],
+    [-4.32510997E-03, 1, 0, 1, 2],
+    [ 8.99281156E-05, 2, 0, 1, 2],
+    [-7.14663943E-07, 3, 0, 1, 2],
+    [-2.66016305E-04, 0, 1, 1, 2],
+    [ 2.63789586E-04, 1, 1, 1, 2],
+    [-7.01199003E-06, 2, 1, 1, 2],
+    [-1.06823306E-04, 0, 2, 1, 2],
+    [ 3.61341136E-06, 1, 2, 1, 2],
+    [ 2.29748967E-07, 0, 3, 1, 2],
+    [ 3.04788893E-04, 0, 0, 2, 2],
+    [-6.42070836E-05, 1, 0, 2, 2],
+    [ 1.16257971E-06, 2, 0, 2, 2],
+    [ 7.68023384E-06, 0, 1, 2, 2],
+    [-5.47446896E-07, 1, 1, 2, 2],
+    [-3.59937910E-08, 0, 2, 2, 2],
+    [-4.36497725E-06, 0, 0, 3, 2],
+    [ 1.68737969E-07, 1, 0, 3, 2],
+    [ 2.67489271E-08, 0, 1, 3, 2],
+    [ 3.23926897E-09, 0, 0, 4, 2],
+    [-3.53874123E-02, 0, 0, 0, 3],
+    [-2.21201190E-01, 1, 0, 0, 3],
+    [ 1.55126038E-02, 2, 0, 0, 3],
+    [-2.63917279E-04, 3, 0, 0, 3],
+    [ 4.53433455E-02, 0, 1, 0, 3],
+    [-4.32943862E-03, 1, 1, 0, 3],
+    [ 1.45389826E-04, 2, 1, 0, 3],
+    [ 2.17508610E-04, 0, 2, 0, 3],
+    [-6.66724702E-05, 1, 2, 0, 3],
+    [ 3.33217140E-05, 0, 3, 0, 3],
+    [-2.26921615E-03, 0, 0, 1, 3],
+    [ 3.80261982E-04, 1, 0, 1, 3],
+    [-5.45314314E-09, 2, 0, 1, 3],
+    [-7.96355448E-04, 0, 1, 1, 3],
+    [ 2.53458034E-05, 1, 1, 1, 3],
+    [-6.31223658E-06, 0, 2, 1, 3],
+    [ 3.02122035E-04, 0, 0, 2, 3],
+    [-4.77403547E-06, 1, 0, 2, 3],
+    [ 1.73825715E-06, 0, 1, 2, 3],
+    [-4.09087898E-07, 0, 0, 3, 3],
+    [ 6.14155345E-01, 0, 0, 0, 4],
+    [-6.16755931E-02, 1, 0, 0, 4],
+    [ 1.33374846E-03, 2, 0, 0, 4],
+    [ 3.55375387E-03, 0, 1, 0, 4],
+    [-5.13027851E-04, 1, 1, 0, 4],
+    [ 1.02449757E-04, 0, 2, 0, 4],
+    [-1.48526421E-03, 0, 0, 1, 4],
+    [-4.11469183E-05, 1, 0, 1, 4],
+    [-6.80434415E-06, 0, 1, 1, 4],
+    [-9.77675906E-06, 0, 0, 2, 4],
+    [ 8.82773108E-02, 0, 0, 0, 5],
+    [-3.01859306E-03, 1, 0, 0, 5],
+    [ 1.04452989E-03, 0, 1, 0, 5],
+    [ 2.47090539E-04, 0, 0, 1, 5],
+    [ 1.48348065E-03, 0, 0, 0, 6],
+])
+_UTCI_TERMS.setflags(write=False)
+
+# Coefficients arranged as _COEFF_TABLE[e, D_Tmrt, ws, Tair] powers for Horner's rule
+_COEFF_TABLE = np.zeros((7, 7, 7, 7))
+_COEFF_TABLE[tuple(_UTCI_TERMS[:, :0:-1].astype(int).T)] = _UTCI_TERMS[:, 0]
+_COEFF_TABLE.setflags(write=False)
+
+# The same coefficients as nested tuples of floats for utci(), each ordered from
+# the highest power down for Horner's rule. The total degree of the regression is
+# 6, so each Tair polynomial stops at the remaining degree.
+_HORNER_COEFFS = tuple(tuple(tuple(tuple(_COEFF_TABLE[i, j, k, 6 - i - j - k::-1].tolist())
+                                   for k in range(6 - i - j, -1, -1))
+                             for j in range(6 - i, -1, -1))
+                       for i in range(6, -1, -1))
+
+# Single-precision copy of _HORNER_COEFFS for utci(..., dtype=numpy.float32)
+_HORNER_COEFFS_F32 = tuple(tuple(tuple(tuple(np.float32(c) for c in t_coeffs) for t_coeffs in w_coeffs)
+                                 for w_coeffs in d_coeffs)
+                           for d_coeffs in _HORNER_COEFFS)
+
+
+def _horner(x, coeffs):
+    """Evaluate a polynomial in x by Horner's rule, coefficients from the highest power down"""
+    coeffs = iter(coeffs)
+    result = next(coeffs)
+    for c in coeffs:
+        result = result * x + c
+    return result
+
+
+def utci(Tair, e, es, ws, D_Tmrt, dtype=np.float64):
     """Universal Thermal Climate Index (UTCI)
 
     Calculates the universal thermal climate index (UTCI) from
@@ -9,26 +255,39 @@ def utci(Tair, e, es, ws, D_Tmrt):
     Brode et al. (2011), https://doi.org/10.1007/s00484-011-0454-1
 
     :param Tair: Ambient temperature (deg C), between -50 and +50 deg C
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :param e: Vapor pressure (kPa), <5 kPa
-    :type e: float
+    :type e: float or numpy.ndarray
     :param es: Saturation vapor pressure (kPa)
-    :type es: float
+    :type es: float or numpy.ndarray
     :param ws: 10-meter wind speed (m/s), < 17 m/s
-    :type ws: float
+    :type ws: float or numpy.ndarray
     :param D_Tmrt: Mean Radiant Temperature minus ambient temperature (deg C)
-    :type D_Tmrt: float
-    :returns: the approximate UTCI in degrees C.
-    :rtype: float 
+    :type D_Tmrt: float or numpy.ndarray
+    :param dtype: Floating-point precision of the calculation. numpy.float32 halves
+	    the memory traffic on large grids and stays within 0.01 deg C of the
+	    double-precision result over the valid input ranges
+    :type dtype: numpy.float64 or numpy.float32
+    :raises ValueError: if dtype is neither numpy.float64 nor numpy.float32
+    :returns: the approximate UTCI in degrees C, in the precision given by dtype
+    :rtype: float or numpy.ndarray
     :examples: utci(30, 2, 4, 2, 15)
     """
 
+    dtype = np.dtype(dtype)
+    if dtype == np.float64:
+        horner_coeffs = _HORNER_COEFFS
+    elif dtype == np.float32:
+        horner_coeffs = _HORNER_COEFFS_F32
+    else:
+        raise ValueError("dtype must be numpy.float64 or numpy.float32, not %s" % dtype)
+    # [()] keeps scalar inputs as NumPy scalars, which are much faster than 0-d arrays
+    Tair, e, es, ws, D_Tmrt = (np.asarray(x, dtype=dtype)[()] for x in (Tair, e, es, ws, D_Tmrt))
+
     # Function is only valid for particular ranges of values; return NaN if any
     # of the values fall outside these ranges.
-    if Tair < -50 or Tair > 50 or e > 5:
-        return np.nan
-    if D_Tmrt < -30 or D_Tmrt > 70 or ws > 30.3:
-        return np.nan
+    valid = ((Tair >= -50) & (Tair <= 50) & (e <= 5) &
+             (D_Tmrt >= -30) & (D_Tmrt <= 70) & (ws <= 30.3))
 
     # The regression is valid only for RH values from 5-100%. Brode et al. (2011)
     # recommends setting e values in instances where RH < 5% to the equivalent vapor
@@ -36,220 +295,14 @@ def utci(Tair, e, es, ws, D_Tmrt):
     #
     rh = (e / es) * 100
 
-    if rh < 5:
-        e = es * 0.05
+    e = np.where(rh < 5, es * 0.05, e)
     
-    utci_approx = (Tair + 
-        ( 6.07562052E-01 ) +
-  		( -2.27712343E-02 ) * Tair +
-  		( 8.06470249E-04 ) * Tair*Tair +
-  		( -1.54271372E-04 ) * Tair*Tair*Tair +
-  		( -3.24651735E-06 ) * Tair*Tair*Tair*Tair +
-  		( 7.32602852E-08 ) * Tair*Tair*Tair*Tair*Tair +
-  		( 1.35959073E-09 ) * Tair*Tair*Tair*Tair*Tair*Tair +
-  		( -2.25836520E+00 ) * ws +
-  		( 8.80326035E-02 ) * Tair*ws +
-  		( 2.16844454E-03 ) * Tair*Tair*ws +
-  		( -1.53347087E-05 ) * Tair*Tair*Tair*ws +
-  		( -5.72983704E-07 ) * Tair*Tair*Tair*Tair*ws +
-  		( -2.55090145E-09 ) * Tair*Tair*Tair*Tair*Tair*ws +
-  		( -7.51269505E-01 ) * ws*ws +
-  		( -4.08350271E-03 ) * Tair*ws*ws +
-  		( -5.21670675E-05 ) * Tair*Tair*ws*ws +
-  		( 1.94544667E-06 ) * Tair*Tair*Tair*ws*ws +
-  		( 1.14099531E-08 ) * Tair*Tair*Tair*Tair*ws*ws +
-  		( 1.58137256E-01 ) * ws*ws*ws +
-  		( -6.57263143E-05 ) * Tair*ws*ws*ws +
-  		( 2.22697524E-07 ) * Tair*Tair*ws*ws*ws +
-  		( -4.16117031E-08 ) * Tair*Tair*Tair*ws*ws*ws +
-  		( -1.27762753E-02 ) * ws*ws*ws*ws +
-  		( 9.66891875E-06 ) * Tair*ws*ws*ws*ws +
-  		( 2.52785852E-09 ) * Tair*Tair*ws*ws*ws*ws +
-  		( 4.56306672E-04 ) * ws*ws*ws*ws*ws +
-  		( -1.74202546E-07 ) * Tair*ws*ws*ws*ws*ws +
-  		( -5.91491269E-06 ) * ws*ws*ws*ws*ws*ws +
-  		( 3.98374029E-01 ) * D_Tmrt +
-  		( 1.83945314E-04 ) * Tair*D_Tmrt +
-  		( -1.73754510E-04 ) * Tair*Tair*D_Tmrt +
-  		( -7.60781159E-07 ) * Tair*Tair*Tair*D_Tmrt +
-  		( 3.77830287E-08 ) * Tair*Tair*Tair*Tair*D_Tmrt +
-  		( 5.43079673E-10 ) * Tair*Tair*Tair*Tair*Tair*D_Tmrt +
-  		( -2.00518269E-02 ) * ws*D_Tmrt +
-  		( 8.92859837E-04 ) * Tair*ws*D_Tmrt +
-  		( 3.45433048E-06 ) * Tair*Tair*ws*D_Tmrt +
-  		( -3.77925774E-07 ) * Tair*Tair*Tair*ws*D_Tmrt +
-  		( -1.69699377E-09 ) * Tair*Tair*Tair*Tair*ws*D_Tmrt +
-  		( 1.69992415E-04 ) * ws*ws*D_Tmrt +
-  		( -4.99204314E-05 ) * Tair*ws*ws*D_Tmrt +
-  		( 2.47417178E-07 ) * Tair*Tair*ws*ws*D_Tmrt +
-  		( 1.07596466E-08 ) * Tair*Tair*Tair*ws*ws*D_Tmrt +
-  		( 8.49242932E-05 ) * ws*ws*ws*D_Tmrt +
-  		( 1.35191328E-06 ) * Tair*ws*ws*ws*D_Tmrt +
-  		( -6.21531254E-09 ) * Tair*Tair*ws*ws*ws*D_Tmrt +
-  		( -4.99410301E-06 ) * ws*ws*ws*ws*D_Tmrt +
-  		( -1.89489258E-08 ) * Tair*ws*ws*ws*ws*D_Tmrt +
-  		( 8.15300114E-08 ) * ws*ws*ws*ws*ws*D_Tmrt +
-  		( 7.55043090E-04 ) * D_Tmrt*D_Tmrt +
-  		( -5.65095215E-05 ) * Tair*D_Tmrt*D_Tmrt +
-  		( -4.52166564E-07 ) * Tair*Tair*D_Tmrt*D_Tmrt +
-  		( 2.46688878E-08 ) * Tair*Tair*Tair*D_Tmrt*D_Tmrt +
-  		( 2.42674348E-10 ) * Tair*Tair*Tair*Tair*D_Tmrt*D_Tmrt +
-  		( 1.54547250E-04 ) * ws*D_Tmrt*D_Tmrt +
-  		( 5.24110970E-06 ) * Tair*ws*D_Tmrt*D_Tmrt +
-  		( -8.75874982E-08 ) * Tair*Tair*ws*D_Tmrt*D_Tmrt +
-  		( -1.50743064E-09 ) * Tair*Tair*Tair*ws*D_Tmrt*D_Tmrt +
-  		( -1.56236307E-05 ) * ws*ws*D_Tmrt*D_Tmrt +
-  		( -1.33895614E-07 ) * Tair*ws*ws*D_Tmrt*D_Tmrt +
-  		( 2.49709824E-09 ) * Tair*Tair*ws*ws*D_Tmrt*D_Tmrt +
-  		( 6.51711721E-07 ) * ws*ws*ws*D_Tmrt*D_Tmrt +
-  		( 1.94960053E-09 ) * Tair*ws*ws*ws*D_Tmrt*D_Tmrt +
-  		( -1.00361113E-08 ) * ws*ws*ws*ws*D_Tmrt*D_Tmrt +
-  		( -1.21206673E-05 ) * D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -2.18203660E-07 ) * Tair*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 7.51269482E-09 ) * Tair*Tair*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 9.79063848E-11 ) * Tair*Tair*Tair*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 1.25006734E-06 ) * ws*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -1.81584736E-09 ) * Tair*ws*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -3.52197671E-10 ) * Tair*Tair*ws*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -3.36514630E-08 ) * ws*ws*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 1.35908359E-10 ) * Tair*ws*ws*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 4.17032620E-10 ) * ws*ws*ws*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -1.30369025E-09 ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 4.13908461E-10 ) * Tair*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 9.22652254E-12 ) * Tair*Tair*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -5.08220384E-09 ) * ws*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -2.24730961E-11 ) * Tair*ws*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 1.17139133E-10 ) * ws*ws*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 6.62154879E-10 ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 4.03863260E-13 ) * Tair*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 1.95087203E-12 ) * ws*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( -4.73602469E-12 ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt +
-  		( 5.12733497E+00 ) * e +
-  		( -3.12788561E-01 ) * Tair*e +
-  		( -1.96701861E-02 ) * Tair*Tair*e +
-  		( 9.99690870E-04 ) * Tair*Tair*Tair*e +
-  		( 9.51738512E-06 ) * Tair*Tair*Tair*Tair*e +
-  		( -4.66426341E-07 ) * Tair*Tair*Tair*Tair*Tair*e +
-  		( 5.48050612E-01 ) * ws*e +
-  		( -3.30552823E-03 ) * Tair*ws*e +
-  		( -1.64119440E-03 ) * Tair*Tair*ws*e +
-  		( -5.16670694E-06 ) * Tair*Tair*Tair*ws*e +
-  		( 9.52692432E-07 ) * Tair*Tair*Tair*Tair*ws*e +
-  		( -4.29223622E-02 ) * ws*ws*e +
-  		( 5.00845667E-03 ) * Tair*ws*ws*e +
-  		( 1.00601257E-06 ) * Tair*Tair*ws*ws*e +
-  		( -1.81748644E-06 ) * Tair*Tair*Tair*ws*ws*e +
-  		( -1.25813502E-03 ) * ws*ws*ws*e +
-  		( -1.79330391E-04 ) * Tair*ws*ws*ws*e +
-  		( 2.34994441E-06 ) * Tair*Tair*ws*ws*ws*e +
-  		( 1.29735808E-04 ) * ws*ws*ws*ws*e +
-  		( 1.29064870E-06 ) * Tair*ws*ws*ws*ws*e +
-  		( -2.28558686E-06 ) * ws*ws*ws*ws*ws*e +
-  		( -3.69476348E-02 ) * D_Tmrt*e +
-  		( 1.62325322E-03 ) * Tair*D_Tmrt*e +
-  		( -3.14279680E-05 ) * Tair*Tair*D_Tmrt*e +
-  		( 2.59835559E-06 ) * Tair*Tair*Tair*D_Tmrt*e +
-  		( -4.77136523E-08 ) * Tair*Tair*Tair*Tair*D_Tmrt*e +
-  		( 8.64203390E-03 ) * ws*D_Tmrt*e +
-  		( -6.87405181E-04 ) * Tair*ws*D_Tmrt*e +
-  		( -9.13863872E-06 ) * Tair*Tair*ws*D_Tmrt*e +
-  		( 5.15916806E-07 ) * Tair*Tair*Tair*ws*D_Tmrt*e +
-  		( -3.59217476E-05 ) * ws*ws*D_Tmrt*e +
-  		( 3.28696511E-05 ) * Tair*ws*ws*D_Tmrt*e +
-  		( -7.10542454E-07 ) * Tair*Tair*ws*ws*D_Tmrt*e +
-  		( -1.24382300E-05 ) * ws*ws*ws*D_Tmrt*e +
-  		( -7.38584400E-09 ) * Tair*ws*ws*ws*D_Tmrt*e +
-  		( 2.20609296E-07 ) * ws*ws*ws*ws*D_Tmrt*e +
-  		( -7.32469180E-04 ) * D_Tmrt*D_Tmrt*e +
-  		( -1.87381964E-05 ) * Tair*D_Tmrt*D_Tmrt*e +
-  		( 4.80925239E-06 ) * Tair*Tair*D_Tmrt*D_Tmrt*e +
-  		( -8.75492040E-08 ) * Tair*Tair*Tair*D_Tmrt*D_Tmrt*e +
-  		( 2.77862930E-05 ) * ws*D_Tmrt*D_Tmrt*e +
-  		( -5.06004592E-06 ) * Tair*ws*D_Tmrt*D_Tmrt*e +
-  		( 1.14325367E-07 ) * Tair*Tair*ws*D_Tmrt*D_Tmrt*e +
-  		( 2.53016723E-06 ) * ws*ws*D_Tmrt*D_Tmrt*e +
-  		( -1.72857035E-08 ) * Tair*ws*ws*D_Tmrt*D_Tmrt*e +
-  		( -3.95079398E-08 ) * ws*ws*ws*D_Tmrt*D_Tmrt*e +
-  		( -3.59413173E-07 ) * D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( 7.04388046E-07 ) * Tair*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( -1.89309167E-08 ) * Tair*Tair*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( -4.79768731E-07 ) * ws*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( 7.96079978E-09 ) * Tair*ws*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( 1.62897058E-09 ) * ws*ws*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( 3.94367674E-08 ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( -1.18566247E-09 ) * Tair*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( 3.34678041E-10 ) * ws*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( -1.15606447E-10 ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*e +
-  		( -2.80626406E+00 ) * e*e +
-  		( 5.48712484E-01 ) * Tair*e*e +
-  		( -3.99428410E-03 ) * Tair*Tair*e*e +
-  		( -9.54009191E-04 ) * Tair*Tair*Tair*e*e +
-  		( 1.93090978E-05 ) * Tair*Tair*Tair*Tair*e*e +
-  		( -3.08806365E-01 ) * ws*e*e +
-  		( 1.16952364E-02 ) * Tair*ws*e*e +
-  		( 4.95271903E-04 ) * Tair*Tair*ws*e*e +
-  		( -1.90710882E-05 ) * Tair*Tair*Tair*ws*e*e +
-  		( 2.10787756E-03 ) * ws*ws*e*e +
-  		( -6.98445738E-04 ) * Tair*ws*ws*e*e +
-  		( 2.30109073E-05 ) * Tair*Tair*ws*ws*e*e +
-  		( 4.17856590E-04 ) * ws*ws*ws*e*e +
-  		( -1.27043871E-05 ) * Tair*ws*ws*ws*e*e +
-  		( -3.04620472E-06 ) * ws*ws*ws*ws*e*e +
-  		( 5.14507424E-02 ) * D_Tmrt*e*e +
-  		( -4.32510997E-03 ) * Tair*D_Tmrt*e*e +
-  		( 8.99281156E-05 ) * Tair*Tair*D_Tmrt*e*e +
-  		( -7.14663943E-07 ) * Tair*Tair*Tair*D_Tmrt*e*e +
-  		( -2.66016305E-04 ) * ws*D_Tmrt*e*e +
-  		( 2.63789586E-04 ) * Tair*ws*D_Tmrt*e*e +
-  		( -7.01199003E-06 ) * Tair*Tair*ws*D_Tmrt*e*e +
-  		( -1.06823306E-04 ) * ws*ws*D_Tmrt*e*e +
-  		( 3.61341136E-06 ) * Tair*ws*ws*D_Tmrt*e*e +
-  		( 2.29748967E-07 ) * ws*ws*ws*D_Tmrt*e*e +
-  		( 3.04788893E-04 ) * D_Tmrt*D_Tmrt*e*e +
-  		( -6.42070836E-05 ) * Tair*D_Tmrt*D_Tmrt*e*e +
-  		( 1.16257971E-06 ) * Tair*Tair*D_Tmrt*D_Tmrt*e*e +
-  		( 7.68023384E-06 ) * ws*D_Tmrt*D_Tmrt*e*e +
-  		( -5.47446896E-07 ) * Tair*ws*D_Tmrt*D_Tmrt*e*e +
-  		( -3.59937910E-08 ) * ws*ws*D_Tmrt*D_Tmrt*e*e +
-  		( -4.36497725E-06 ) * D_Tmrt*D_Tmrt*D_Tmrt*e*e +
-  		( 1.68737969E-07 ) * Tair*D_Tmrt*D_Tmrt*D_Tmrt*e*e +
-  		( 2.67489271E-08 ) * ws*D_Tmrt*D_Tmrt*D_Tmrt*e*e +
-  		( 3.23926897E-09 ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*e*e +
-  		( -3.53874123E-02 ) * e*e*e +
-  		( -2.21201190E-01 ) * Tair*e*e*e +
-  		( 1.55126038E-02 ) * Tair*Tair*e*e*e +
-  		( -2.63917279E-04 ) * Tair*Tair*Tair*e*e*e +
-  		( 4.53433455E-02 ) * ws*e*e*e +
-  		( -4.32943862E-03 ) * Tair*ws*e*e*e +
-  		( 1.45389826E-04 ) * Tair*Tair*ws*e*e*e +
-  		( 2.17508610E-04 ) * ws*ws*e*e*e +
-  		( -6.66724702E-05 ) * Tair*ws*ws*e*e*e +
-  		( 3.33217140E-05 ) * ws*ws*ws*e*e*e +
-  		( -2.26921615E-03 ) * D_Tmrt*e*e*e +
-  		( 3.80261982E-04 ) * Tair*D_Tmrt*e*e*e +
-  		( -5.45314314E-09 ) * Tair*Tair*D_Tmrt*e*e*e +
-  		( -7.96355448E-04 ) * ws*D_Tmrt*e*e*e +
-  		( 2.53458034E-05 ) * Tair*ws*D_Tmrt*e*e*e +
-  		( -6.31223658E-06 ) * ws*ws*D_Tmrt*e*e*e +
-  		( 3.02122035E-04 ) * D_Tmrt*D_Tmrt*e*e*e +
-  		( -4.77403547E-06 ) * Tair*D_Tmrt*D_Tmrt*e*e*e +
-  		( 1.73825715E-06 ) * ws*D_Tmrt*D_Tmrt*e*e*e +
-  		( -4.09087898E-07 ) * D_Tmrt*D_Tmrt*D_Tmrt*e*e*e +
-  		( 6.14155345E-01 ) * e*e*e*e +
-  		( -6.16755931E-02 ) * Tair*e*e*e*e +
-  		( 1.33374846E-03 ) * Tair*Tair*e*e*e*e +
-  		( 3.55375387E-03 ) * ws*e*e*e*e +
-  		( -5.13027851E-04 ) * Tair*ws*e*e*e*e +
-  		( 1.02449757E-04 ) * ws*ws*e*e*e*e +
-  		( -1.48526421E-03 ) * D_Tmrt*e*e*e*e +
-  		( -4.11469183E-05 ) * Tair*D_Tmrt*e*e*e*e +
-  		( -6.80434415E-06 ) * ws*D_Tmrt*e*e*e*e +
-  		( -9.77675906E-06 ) * D_Tmrt*D_Tmrt*e*e*e*e +
-  		( 8.82773108E-02 ) * e*e*e*e*e +
-  		( -3.01859306E-03 ) * Tair*e*e*e*e*e +
-  		( 1.04452989E-03 ) * ws*e*e*e*e*e +
-  		( 2.47090539E-04 ) * D_Tmrt*e*e*e*e*e +
-  		( 1.48348065E-03 ) * e*e*e*e*e*e)
-
-    return utci_approx
+    # Horner's rule in e, D_Tmrt, ws, and Tair in turn
+    p_e = [_horner(D_Tmrt, [_horner(ws, [_horner(Tair, t_coeffs) for t_coeffs in w_coeffs])
+                            for w_coeffs in d_coeffs])
+           for d_coeffs in horner_coeffs]
+
+    utci_approx = Tair + _horner(e, p_e)
+
+    return np.where(valid, utci_approx, np.nan)[()]
 
@@ -1,4 +1,14 @@
-﻿import math
+﻿import numpy as np
+
+# CONSTANTS ____________________________________________________________________
+_M_AIR = 28.97
+_SIGMA = 3.617
+_EPS_KAPPA = 97.0
+# Collision integral omega = (Tair / eps_kappa - 2.9) / 0.4 * (-0.034) + 1.048,
+# folded into omega = _OMEGA_A * Tair + _OMEGA_B
+_OMEGA_A = -0.034 / 0.4 / _EPS_KAPPA
+_OMEGA_B = 1.048 + 0.034 / 0.4 * 2.9
+_MU_COEF = 2.6693e-6 * np.sqrt(_M_AIR) / (_SIGMA * _SIGMA)
 
 def viscosity(Tair):
     """Viscosity
@@ -8,18 +18,11 @@ def viscosity(Tair):
     and the convective heat transfer coefficient.
 
     :param Tair: Air temperature (K)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :returns: the air viscosity in units of kg/(m⋅s)
-    :rtype: float
+    :rtype: float or numpy.ndarray
     :examples: viscosity(290)
     """
 
-    # CONSTANTS ________________________________________________________________
-    M_AIR = 28.97
-    sigma = 3.617
-    eps_kappa = 97.0
-
-    Tr = Tair / eps_kappa
-    omega = (Tr - 2.9) / 0.4 * (-0.034) + 1.048
-    return (2.6693e-6 * math.sqrt(M_AIR * Tair) / (sigma * sigma * omega))
+    return _MU_COEF * np.sqrt(Tair) / (_OMEGA_A * Tair + _OMEGA_B)
 
@@ -1,13 +1,8 @@
 ﻿import numpy as np
-from . import calc_solar_parameters
 from .calc_solar_parameters import calc_solar_parameters
-from . import stab_srdt
 from .stab_srdt import stab_srdt
-from . import est_wind_speed
 from .est_wind_speed import est_wind_speed
-from . import Tglobe
 from .Tglobe import Tglobe
-from . import Twb
 from .Twb import Twb
 
 def wbgt(year, month, dday, lat, lon, solar, cza, fdir, pres, Tair, 
@@ -23,55 +18,78 @@ def wbgt(year, month, dday, lat, lon, solar, cza, fdir, pres, Tair,
     The program predicts Tw and Tg using meteorological input data, and then combines
     the results to produce WBGT.
 
+    All inputs may be NumPy arrays that broadcast against each other. For gridded
+    data, pass a whole grid (or a whole time series) in one call rather than
+    looping over cells: the solar position is then computed once per date, and
+    the Tg and Tw solvers iterate over all cells together.
+
     Reference: Liljegren, et al. Modeling the Wet Bulb Globe Temperature Using
     Standard Meteorological Measurements. J. Occup. Environ. Hyg. 5, 645-655 (2008).
     https://doi.org/10.1080/15459620802310770
 
     :param year: 4-digit integer, e.g., 2007
-    :type year: int
+    :type year: int or numpy.ndarray
     :param month: Month (1-12) or month = 0 if reporting day as day of year
-    :type month: int
+    :type month: int or numpy.ndarray
     :param dday: Decimal day of month (1-31.96) -or- day of year (1-366.96), in UTC day-	fractions
-    :type dday: float
+    :type dday: float or numpy.ndarray
     :param lat: Degrees north latitude (-90 to 90)
-    :type lat: float
+    :type lat: float or numpy.ndarray
     :param lon: Degrees east longitude (-180 to 180)
-    :type lon: float
+    :type lon: float or numpy.ndarray
     :param solar: Solar irradiance (W/m2)
-    :type solar: float
-    :param cza: Cosine solar zenith angle (0-1); use calc_cza_int() or 	calc_solar_parameters()$cza if cza is not known
-    :type cza: float
+    :type solar: float or numpy.ndarray
+    :param cza: Cosine solar zenith angle (0-1); use calc_cza_int() or 	calc_solar_parameters().cza if cza is not known
+    :type cza: float or numpy.ndarray
     :param fdir: Fraction of surface solar radiation that is direct (0-1)
-    :type fdir: float 
+    :type fdir: float or numpy.ndarray
     :param pres: Barometric pressure in millibars (equivalent to hPa)
-    :type pres: float
+    :type pres: float or numpy.ndarray
     :param Tair: Dry-bulb air temperature (deg. C)
-    :type Tair: float
+    :type Tair: float or numpy.ndarray
     :param relhum: Relative humidity (\%)
-    :type relhum: float
+    :type relhum: float or numpy.ndarray
     :param speed: Wind speed (m/s)
-    :type speed: float
+    :type speed: float or numpy.ndarray
     :param zspeed: Height of wind-speed measurement, meters (typically 10m)
-    :type zspeed: float
+    :type zspeed: float or numpy.ndarray
     :param dT: Vertical temperature difference (upper minus lower) in degrees Celsius
-    :type dT: float
+    :type dT: float or numpy.ndarray
     :param urban: 1 for urban locations or 0 for non-urban locations
-    :type urban: int
-    :returns: the wet-bulb globe temperature in degrees C.
-    :rtype: float
-    :examples: wbgt(2020, 7, 4.5, 42.36, -71.06, 700, 0.5, 0.5, 1013, 30, 60, 2, 10, -0.052, 1)
+    :type urban: int or numpy.ndarray
+    :returns: the wet-bulb globe temperature in degrees C. NaN for missing data,
+	    and where cza < 0.01 but the direct-beam irradiance on a horizontal surface
+	    (fdir ⋅ solar) exceeds what the sun can supply at that angle (1367 ⋅ 0.01 W/m2)
+    :rtype: float or numpy.ndarray
+    :examples: wbgt(2020, 7, 4.5, 42.36, -71.06, 700, 0.5, 0.5, 1013, 30, 60, 2, 10, -0.052, 1) returns 30.0585
     """
 
     inputs = [year, month, dday, lat, lon, solar, cza, fdir, pres, Tair, 
                   relhum, speed, zspeed, dT, urban]
-    # Check for missing data and return NaN
-    if (any(np.isnan(x) for x in inputs)) or (-999 in inputs):
-        return np.nan
+    # Flag missing data (NaN or -999); those cells are returned as NaN. Scalar
+    # inputs are checked together in one pass, array inputs cell by cell
+    inputs = [np.asarray(x, dtype=float) for x in inputs]
+    scalars = np.array([x for x in inputs if x.ndim == 0])
+    missing = ((scalars != scalars) | (scalars == -999)).any()
+    for x in inputs:
+        if x.ndim > 0:
+            missing = missing | (x != x) | (x == -999)
+    if missing.ndim == 0:
+        if missing:
+            return np.nan
+    else:
+        # Carry missing cells through the calculations below as NaN. The inputs of
+        # the 2-meter wind estimate get harmless placeholders so that sentinel values
+        # there do not raise floating-point warnings before the cells are masked
+        Tair = np.where(missing, np.nan, Tair)
+        speed = np.where(missing, 0.0, speed)
+        zspeed = np.where(missing, 2.0, zspeed)
+        dT = np.where(missing, 0.0, dT)
 
     # cza and fdir are assumed to be known. If they are not, set them to NaN here
     # and the calc_solar_parameters() function will calculate approximations of them
     #
-    solar = calc_solar_parameters(year, month, dday, lat, lon, solar, cza, fdir)['solarRet'] # adjusted solar irradiance if out of bounds
+    solar = calc_solar_parameters(year, month, dday, lat, lon, solar, cza, fdir).solarRet # adjusted solar irradiance if out of bounds
 
     # *********************************************** #
     #  estimate the 2-meter wind speed, if necessary  #
@@ -79,15 +97,13 @@ def wbgt(year, month, dday, lat, lon, solar, cza, fdir, pres, Tair,
 
     REF_HEIGHT = 2.0 # 2-meter reference height
     MINIMUM_SPEED = 0.5
-    if(zspeed != REF_HEIGHT):
-        if(cza > 0):
-            daytime = True
-        else:
-            daytime = False
-        stability_class = stab_srdt(daytime, speed, solar, dT)
-        speed = est_wind_speed(speed, zspeed, stability_class, urban)
-    else:
-       speed <- max(speed, MINIMUM_SPEED) 
+    SOLAR_CONST = 1367.0
+    CZA_MIN = 0.01   # Tglobe() and Twb() treat smaller cza as 0.01
+    daytime = cza > 0
+    stability_class = stab_srdt(daytime, speed, solar, dT)
+    speed = np.where(zspeed != REF_HEIGHT,
+                     est_wind_speed(speed, zspeed, stability_class, urban),
+                     np.maximum(speed, MINIMUM_SPEED))
 
     # **************** #
     # Unit Conversions #
@@ -106,6 +122,13 @@ def wbgt(year, month, dday, lat, lon, solar, cza, fdir, pres, Tair,
     Tnwb = Twb(tk, rh, pres, speed, solar, fdir, cza)
     Twbg = (0.1 * Tair) + (0.2 * Tg) + (0.7 * Tnwb)
 
-    return Twbg
+    # With the sun at the horizon, Tglobe() and Twb() project the direct beam as if
+    # cza were CZA_MIN. A horizontal direct beam larger than the top of the
+    # atmosphere can supply at that angle is inconsistent and gives globe and
+    # wet-bulb temperatures far too high (e.g., WBGT above 100 deg C), so those
+    # cells are returned as NaN
+    inconsistent = (cza < CZA_MIN) & (fdir * solar > SOLAR_CONST * CZA_MIN)
+
+    return np.where(inconsistent, np.nan, Twbg)[()]
 
 
@@ -0,0 +1,14 @@
+import unittest
+
+from heatmetrics_python.calc_cza import calc_cza
+
+class TestCalcCza(unittest.TestCase):
+
+    def test_hour_past_24_carries_into_next_day(self):
+        self.assertAlmostEqual(calc_cza(40, 150, 2020, 3, 20, 24.5), 0.7060, places=4)
+        self.assertEqual(calc_cza(40, 150, 2020, 3, 20, 24.5), calc_cza(40, 150, 2020, 3, 21, 0.5))
+        # across the end of the year
+        self.assertEqual(calc_cza(40, 150, 2020, 12, 31, 25.0), calc_cza(40, 150, 2021, 1, 1, 1.0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+from heatmetrics_python.solarposition import solarposition
+from heatmetrics_python.solarposition_batch import solarposition_batch
+
+class TestSolarPosition(unittest.TestCase):
+
+    def test_refraction_near_horizon(self):
+        # Boston shortly before sunset, altitude about 3.2 deg, where the
+        # low-altitude refraction polynomial applies
+        position = solarposition(2020, 7, 4.0, 0, 42.36, -71.06)
+        self.assertAlmostEqual(position["refraction"], 0.2341, places=4)
+        self.assertAlmostEqual(position["altitude"], 3.2427, places=4)
+        batch = solarposition_batch(2020, 7, 4.0, 0, 42.36, -71.06)
+        self.assertAlmostEqual(float(batch["refraction"]), position["refraction"], places=9)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+
+from heatmetrics_python.Tglobe import Tglobe
+from heatmetrics_python.Twb import Twb
+
+def _random_cells(n=50, seed=0):
+    """Physically plausible inputs for Tglobe() and Twb(), one row per cell"""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(263, 318, n),    # Tair (K)
+            rng.uniform(0.05, 1, n),     # rh
+            rng.uniform(950, 1030, n),   # Pair
+            rng.uniform(0, 10, n),       # speed
+            rng.uniform(0, 1000, n),     # solar
+            rng.uniform(0, 0.9, n),      # fdir
+            rng.uniform(0.05, 1, n))     # cza
+
+class TestSolvers(unittest.TestCase):
+
+    def test_scalar_and_array_agree(self):
+        # Cells converge at different iterations of the batched Newton solve
+        cells = _random_cells()
+        for solver in (Tglobe, Twb):
+            array_result = solver(*cells)
+            scalar_result = [solver(*cell) for cell in zip(*cells)]
+            np.testing.assert_allclose(array_result, scalar_result, rtol=1e-12)
+            self.assertIsInstance(solver(*(c[0] for c in cells)), float)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+import numpy as np
+
+from heatmetrics_python.utci import utci
+
+class TestUtci(unittest.TestCase):
+
+    def test_float32_matches_float64(self):
+        # Sample the validity range of the UTCI polynomial
+        rng = np.random.default_rng(0)
+        n = 200000
+        Tair = rng.uniform(-50, 50, n)
+        D_Tmrt = rng.uniform(-30, 70, n)
+        ws = rng.uniform(0.5, 17, n)
+        # Tetens saturation vapor pressure (kPa), humidity 5-100 % capped at e = 5 kPa
+        es = 0.6108 * np.exp(17.27 * Tair / (Tair + 237.3))
+        e = np.minimum(es * rng.uniform(0.05, 1.0, n), 5.0)
+
+        utci64 = utci(Tair, e, es, ws, D_Tmrt)
+        utci32 = utci(Tair, e, es, ws, D_Tmrt, dtype=np.float32)
+
+        self.assertEqual(utci32.dtype, np.float32)
+        self.assertEqual(utci64.dtype, np.float64)
+        np.testing.assert_array_equal(np.isnan(utci32), np.isnan(utci64))
+        self.assertLess(np.nanmax(np.abs(utci64 - utci32)), 0.01)
+
+    def test_invalid_dtype(self):
+        with self.assertRaises(ValueError):
+            utci(30, 2, 4, 2, 10, dtype=np.int32)
+
+if __name__ == "__main__":
+    unittest.main()
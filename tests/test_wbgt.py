@@ -0,0 +1,68 @@
+import unittest
+import warnings
+
+import numpy as np
+
+from heatmetrics_python.wbgt import wbgt
+
+# Inputs of the wbgt() docstring example
+EXAMPLE = dict(year=2020, month=7, dday=4.5, lat=42.36, lon=-71.06, solar=700, cza=0.5,
+               fdir=0.5, pres=1013, Tair=30, relhum=60, speed=2, zspeed=10, dT=-0.052,
+               urban=1)
+MINIMUM_SPEED = 0.5
+
+# Sun at the horizon (cza below the 0.01 that Tglobe() and Twb() clamp to) with a
+# strong direct beam; the Newton solvers return WBGT of about 130 deg C here
+HORIZON_DIRECT_BEAM = dict(year=2013, month=2, dday=23.5004, lat=53.63, lon=120.54,
+                           solar=1021.8, cza=0.0082, fdir=0.92, pres=1013, Tair=17.95,
+                           relhum=50, speed=2, zspeed=10, dT=-0.05, urban=0)
+
+
+class TestWbgt(unittest.TestCase):
+
+    def test_docstring_example(self):
+        # 30.0693 before the Newton solvers
+        self.assertAlmostEqual(wbgt(**EXAMPLE), 30.0585, places=4)
+
+    def test_direct_beam_at_horizon_is_nan(self):
+        self.assertTrue(np.isnan(wbgt(**HORIZON_DIRECT_BEAM)))
+        # a direct beam the sun can supply at that angle is still evaluated
+        self.assertFalse(np.isnan(wbgt(**dict(HORIZON_DIRECT_BEAM, solar=10.0))))
+        cza = np.array([0.0082, 0.5])
+        result = wbgt(**dict(HORIZON_DIRECT_BEAM, cza=cza))
+        self.assertTrue(np.isnan(result[0]))
+        self.assertLess(result[1], 40)
+
+    def test_scalar_and_array_agree(self):
+        rng = np.random.default_rng(1)
+        n = 20
+        arrays = dict(Tair=rng.uniform(0, 40, n), relhum=rng.uniform(10, 100, n),
+                      speed=rng.uniform(0, 8, n), cza=rng.uniform(0, 1, n),
+                      zspeed=np.where(rng.uniform(size=n) < 0.5, 2.0, 10.0))
+        array_result = wbgt(**dict(EXAMPLE, **arrays))
+        scalar_result = [wbgt(**dict(EXAMPLE, **{k: v[i] for k, v in arrays.items()}))
+                         for i in range(n)]
+        np.testing.assert_allclose(array_result, scalar_result, rtol=1e-9)
+
+    def test_missing_data(self):
+        # -999 or NaN in any checked input gives NaN for that cell only, without warnings
+        for name in ("lat", "Tair", "speed", "zspeed", "dT"):
+            values = np.array([EXAMPLE[name], -999, np.nan], dtype=float)
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", RuntimeWarning)
+                self.assertTrue(np.isnan(wbgt(**dict(EXAMPLE, **{name: -999}))))
+                result = wbgt(**dict(EXAMPLE, **{name: values}))
+            self.assertAlmostEqual(result[0], 30.0585, places=4)
+            self.assertTrue(np.isnan(result[1:]).all())
+
+    def test_minimum_speed_at_reference_height(self):
+        # Wind measured at the 2 m reference height is only clamped to MINIMUM_SPEED
+        at_minimum = wbgt(**dict(EXAMPLE, speed=MINIMUM_SPEED, zspeed=2.0))
+        self.assertEqual(wbgt(**dict(EXAMPLE, speed=0.1, zspeed=2.0)), at_minimum)
+        self.assertEqual(wbgt(**dict(EXAMPLE, speed=0.0, zspeed=2.0)), at_minimum)
+        speeds = np.array([0.0, 0.1, 0.3, MINIMUM_SPEED])
+        np.testing.assert_array_equal(wbgt(**dict(EXAMPLE, speed=speeds, zspeed=2.0)), at_minimum)
+
+
+if __name__ == "__main__":
+    unittest.main()